@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration shared by the service containers
+========================================================
+
+Monitoring dashboards poll the same few endpoints every few seconds, so
+connections are kept open between polls instead of paying a new TCP (and
+TLS at the ingress) handshake per request. gthread workers are the only
+sync-style worker class that honours keepalive.
+
+Every setting can be overridden from the environment.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8001')}"
+
+# Each worker holds its own database pools, so the database (or PgBouncer) sees
+# up to workers * DB_POOL_MAX connections per container. The fixed default
+# matches the pool sizing; a cpu_count() default would follow the host's CPUs,
+# not the container's limit. Raise GUNICORN_WORKERS together with that budget
+workers = int(os.getenv('GUNICORN_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Idle seconds a client connection stays open waiting for the next poll;
+# gunicorn answers with Connection: keep-alive while this is non-zero
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 30))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
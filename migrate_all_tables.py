@@ -7,6 +7,7 @@ Migrates all important tables from Digital Ocean to local enhanced database.
 """
 
 import subprocess
+import shutil
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import logging
@@ -57,6 +58,10 @@ class CompleteDatabaseMigrator:
             'game_weather',
             'stadium_weather',
         ]
+        
+        # Tables at or above this row count use pg_dump's parallel directory format
+        self.parallel_dump_threshold = int(os.getenv('PARALLEL_DUMP_THRESHOLD', 1000000))
+        self.parallel_dump_jobs = str(os.getenv('PARALLEL_DUMP_JOBS', 4))
     
     def analyze_source_tables(self):
         """Analyze all source tables in Digital Ocean"""
@@ -127,13 +132,27 @@ class CompleteDatabaseMigrator:
             logger.error(f"Error checking if {table_name} exists: {e}")
             return False
     
-    def migrate_table_schema_and_data(self, table_name):
-        """Migrate both schema and data for a table using pg_dump"""
-        logger.info(f"🔄 Migrating {table_name}...")
+    def migrate_table_schema_and_data(self, table_name, parallel=False):
+        """Migrate both schema and data for a table using pg_dump
+        
+        Large tables (parallel=True) are dumped in directory format and
+        restored with pg_restore so both sides run with multiple workers;
+        small lookup tables keep the plain SQL path.
+        """
+        logger.info(f"🔄 Migrating {table_name}{' (parallel)' if parallel else ''}...")
         
         try:
             # Step 1: Export schema and data from Digital Ocean
-            dump_file = f"{table_name}_migration.sql"
+            if parallel:
+                dump_file = f"{table_name}_dump"
+                format_args = ['-Fd', '-j', self.parallel_dump_jobs]
+                
+                # pg_dump refuses to write into an existing directory
+                if os.path.exists(dump_file):
+                    shutil.rmtree(dump_file)
+            else:
+                dump_file = f"{table_name}_migration.sql"
+                format_args = []
             
             dump_command = [
                 'pg_dump',
@@ -141,6 +160,7 @@ class CompleteDatabaseMigrator:
                 '-p', str(self.do_conn_params['port']),
                 '-U', self.do_conn_params['user'],
                 '-d', self.do_conn_params['database'],
+                *format_args,
                 '--table', table_name,
                 '--file', dump_file
             ]
@@ -173,14 +193,25 @@ class CompleteDatabaseMigrator:
                     logger.warning(f"  ⚠️ Could not drop {table_name}: {result.stderr}")
             
             # Step 3: Import schema and data to local database
-            import_command = [
-                'psql',
-                '-h', self.local_conn_params['host'],
-                '-p', str(self.local_conn_params['port']),
-                '-U', self.local_conn_params['user'],
-                '-d', self.local_conn_params['database'],
-                '-f', dump_file
-            ]
+            if parallel:
+                import_command = [
+                    'pg_restore',
+                    '-h', self.local_conn_params['host'],
+                    '-p', str(self.local_conn_params['port']),
+                    '-U', self.local_conn_params['user'],
+                    '-d', self.local_conn_params['database'],
+                    '-j', self.parallel_dump_jobs,
+                    dump_file
+                ]
+            else:
+                import_command = [
+                    'psql',
+                    '-h', self.local_conn_params['host'],
+                    '-p', str(self.local_conn_params['port']),
+                    '-U', self.local_conn_params['user'],
+                    '-d', self.local_conn_params['database'],
+                    '-f', dump_file
+                ]
             
             result = subprocess.run(import_command, env=env_local, capture_output=True, text=True)
             
@@ -201,7 +232,9 @@ class CompleteDatabaseMigrator:
             logger.info(f"  ✅ {table_name}: {local_count:,} records migrated")
             
             # Clean up dump file
-            if os.path.exists(dump_file):
+            if os.path.isdir(dump_file):
+                shutil.rmtree(dump_file)
+            elif os.path.exists(dump_file):
                 os.remove(dump_file)
             
             return True
@@ -223,7 +256,8 @@ class CompleteDatabaseMigrator:
         
         for table in self.tables_to_migrate:
             if table in source_stats and source_stats[table]['records'] > 0:
-                success = self.migrate_table_schema_and_data(table)
+                parallel = source_stats[table]['records'] >= self.parallel_dump_threshold
+                success = self.migrate_table_schema_and_data(table, parallel=parallel)
                 migration_results[table] = success
                 
                 if success:
@@ -126,6 +126,72 @@ class StatcastMigrator:
             logger.error(f"Failed to clear local data: {e}")
             raise
     
+    def drop_secondary_indexes(self):
+        """Drop non-constraint indexes on local Statcast table before bulk load
+        
+        Indexes backing the primary key / unique constraints are kept so the
+        ON CONFLICT clause in the batch insert still resolves. Returns the
+        dropped index definitions so they can be rebuilt after the load.
+        """
+        logger.info("Dropping secondary Statcast indexes for bulk load...")
+        
+        local_conn = self.get_local_connection()
+        cursor = local_conn.cursor()
+        
+        try:
+            cursor.execute("""
+                SELECT i.indexname, i.indexdef
+                FROM pg_indexes i
+                WHERE i.schemaname = 'public'
+                  AND i.tablename = 'statcast'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM pg_constraint c
+                      WHERE c.conindid = (quote_ident(i.schemaname) || '.' || quote_ident(i.indexname))::regclass
+                  )
+            """)
+            index_defs = cursor.fetchall()
+            
+            for index_name, _ in index_defs:
+                cursor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+                logger.info(f"  Dropped index {index_name}")
+            
+            local_conn.commit()
+            return index_defs
+            
+        except Exception as e:
+            local_conn.rollback()
+            logger.error(f"Failed to drop secondary indexes: {e}")
+            return []
+        finally:
+            cursor.close()
+            local_conn.close()
+    
+    def rebuild_indexes(self, index_defs):
+        """Recreate previously dropped Statcast indexes in a single pass"""
+        if not index_defs:
+            return
+        
+        logger.info(f"Rebuilding {len(index_defs)} Statcast indexes...")
+        
+        local_conn = self.get_local_connection()
+        cursor = local_conn.cursor()
+        
+        try:
+            for index_name, index_def in index_defs:
+                try:
+                    cursor.execute(index_def)
+                    local_conn.commit()
+                    logger.info(f"  Rebuilt index {index_name}")
+                except Exception as e:
+                    local_conn.rollback()
+                    logger.error(f"  Failed to rebuild index {index_name}: {e}")
+            
+            cursor.execute("ANALYZE statcast")
+            local_conn.commit()
+        finally:
+            cursor.close()
+            local_conn.close()
+    
     def migrate_statcast_batch(self, year: int, month: int, batch_size: int = 10000):
         """Migrate Statcast data for a specific month in batches"""
         logger.info(f"Migrating {year}-{month:02d} Statcast data...")
@@ -244,14 +310,21 @@ class StatcastMigrator:
             
             total_migrated = 0
             
-            # Migrate each month
-            for year, month in months_to_migrate:
-                try:
-                    month_migrated = self.migrate_statcast_batch(year, month)
-                    total_migrated += month_migrated
-                except Exception as e:
-                    logger.error(f"Failed to migrate {year}-{month:02d}: {e}")
-                    continue
+            # Drop secondary indexes so batches skip per-row index maintenance
+            dropped_indexes = self.drop_secondary_indexes()
+            
+            try:
+                # Migrate each month
+                for year, month in months_to_migrate:
+                    try:
+                        month_migrated = self.migrate_statcast_batch(year, month)
+                        total_migrated += month_migrated
+                    except Exception as e:
+                        logger.error(f"Failed to migrate {year}-{month:02d}: {e}")
+                        continue
+            finally:
+                # Bulk-build indexes once after the load
+                self.rebuild_indexes(dropped_indexes)
             
             # Validate migration
             logger.info("🔍 Validating migration...")
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service Package
+========================
+
+Flask services, database managers, external API integrations and the
+collection scheduler for MLB data.
+
+Modules import each other relatively, so the package is loaded as
+``mlb_data_service`` (e.g. ``gunicorn mlb_data_service.app:app``)
+without any sys.path setup.
+"""
+
+__version__ = "1.0.0"
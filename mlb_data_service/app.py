@@ -7,159 +7,334 @@ Main Flask application for MLB Data Service microservice.
 Provides REST API endpoints for external data collection and serving.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, make_response, request, g, stream_with_context
 from flask_cors import CORS
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import atexit
+import fcntl
+import hashlib
+import itertools
 import logging
+import logging.handlers
 import os
-import sys
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import queue
+import threading
 
 # Import external API manager, database, and scheduler
-from external_apis import ExternalAPIManager
-from database import DatabaseManager
-from scheduler import start_scheduler, get_scheduler
+from .external_apis import ExternalAPIManager
+from .database import DatabaseManager
+from .job_store import CollectionJobStore
+from .scheduler import start_scheduler
+from .json_provider import OrjsonProvider
+from .request_helpers import etag_requested, request_payload
+from .ttl_cache import TTLCache
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Flask 2.3+ reads these from the provider rather than JSON_SORT_KEYS /
+# JSONIFY_PRETTYPRINT_REGULAR; never sort or indent, even under debug
+app.json.sort_keys = False
+app.json.compact = True
+app.config.update(
+    TESTING=False,
+    PROPAGATE_EXCEPTIONS=True,
+    SEND_FILE_MAX_AGE_DEFAULT=3600,
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_MIN_SIZE=1024,
+    COMPRESS_ALGORITHM=['br', 'gzip']
+)
 CORS(app)
+Compress(app)
 
 # Initialize external API manager, database, and scheduler
 api_manager = ExternalAPIManager()
 db_manager = DatabaseManager()
 
-# Global scheduler instance
+# Global scheduler instance, owned by one process per host (see start_scheduler_once)
 scheduler = None
+scheduler_lock_fd = None
+SCHEDULER_ENABLED = os.getenv('SCHEDULER_ENABLED', 'true').lower() == 'true'
+SCHEDULER_LOCK_PATH = os.getenv('SCHEDULER_LOCK_PATH', '/tmp/mlb-scheduler.lock')
+SCHEDULER_SERVICE_URL = os.getenv('SCHEDULER_SERVICE_URL', 'http://localhost:8001')
+
+# Read caches, cleared whenever the matching collection writes new data.
+# The worker that ran the collection clears its own caches right away; every
+# other worker notices the new completion in collection_status within
+# COLLECTION_CHECK_TTL seconds (see sync_collection_caches)
+CACHE_TTL_SECONDS = int(os.getenv('RESPONSE_CACHE_TTL', 300))
+COLLECTION_CHECK_TTL_SECONDS = float(os.getenv('COLLECTION_CHECK_TTL', 5.0))
+players_cache = TTLCache(ttl=CACHE_TTL_SECONDS)
+games_cache = TTLCache(ttl=CACHE_TTL_SECONDS)
+statcast_cache = TTLCache(ttl=CACHE_TTL_SECONDS)
+stats_cache = TTLCache(ttl=CACHE_TTL_SECONDS)
+last_collections_cache = TTLCache(ttl=COLLECTION_CHECK_TTL_SECONDS, maxsize=1)
+seen_collections = {}
+seen_collections_lock = threading.Lock()
+
+# Statcast requests above this many rows (or unlimited) stream row by row
+STATCAST_STREAM_THRESHOLD = int(os.getenv('STATCAST_STREAM_THRESHOLD', 1000))
+
+# Liveness probes hit /health every few seconds; share one ping per window
+DB_PING_TTL_SECONDS = float(os.getenv('DB_PING_TTL', 2.0))
+db_ping_cache = TTLCache(ttl=DB_PING_TTL_SECONDS, maxsize=1)
+
+collection_caches = {
+    'players': players_cache,
+    'games': games_cache,
+    'statcast': statcast_cache
+}
+
+# Background collection jobs, polled through /api/v1/jobs/<job_id>; job state
+# lives in the collection_jobs table so any worker can answer the poll
+collection_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='collection')
+JOB_RETENTION_SECONDS = 3600
+job_store = CollectionJobStore(
+    db_manager.get_connection, db_manager.return_connection, retention_seconds=JOB_RETENTION_SECONDS
+)
+
+# Encoded steady-state /health body; only the timestamp varies between probes
+SERVICE_VERSION = '1.0.0'
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","service":"MLB Data Service","database":"connected",'
+    b'"timestamp":"%s","version":"' + SERVICE_VERSION.encode() + b'"}'
+)
+
+def check_database_connection():
+    """Return the database ping result, re-pinging at most once per TTL window"""
+    return db_ping_cache.get_or_set('ping', db_manager.test_connection)
+
+def load_collection_stats():
+    """Fetch collection stats, recording a successful query as a live ping"""
+    stats = db_manager.get_collection_stats()
+    if stats.get('data_counts'):
+        db_ping_cache.set('ping', True)
+    return stats
+
+def sync_collection_caches():
+    """Return the last completion per collection type, clearing this worker's
+    read caches for any type that completed since it last looked"""
+    last_collections = last_collections_cache.get_or_set('last', db_manager.get_last_collections)
+    with seen_collections_lock:
+        for collection_type, completed_at in last_collections.items():
+            if seen_collections.get(collection_type) != completed_at:
+                seen_collections[collection_type] = completed_at
+                if collection_type in collection_caches:
+                    collection_caches[collection_type].clear()
+                stats_cache.clear()
+    return last_collections
+
+def last_collection_time(collection_type):
+    """Return when collection_type last completed, looked up once per request"""
+    if 'last_collections' not in g:
+        g.last_collections = sync_collection_caches()
+    return g.last_collections.get(collection_type)
 
-# Configure logging
+def collection_etag(collection_type):
+    """Answer repeat GETs with 304 until collection_type is collected again"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            last_updated = last_collection_time(collection_type)
+            etag = hashlib.md5(
+                f"{collection_type}:{last_updated}:{g.today}:{request.query_string.decode()}".encode()
+            ).hexdigest()
+            
+            if etag_requested(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+            
+            response.set_etag(etag)
+            response.cache_control.max_age = 60
+            return response
+        return wrapper
+    return decorator
+
+def invalidate_collection_cache(collection_type):
+    """Drop cached reads affected by a completed collection
+
+    Call after the completion is logged, so a read refilling the caches
+    sees the new collection time.
+    """
+    collection_caches[collection_type].clear()
+    stats_cache.clear()
+    last_collections_cache.clear()
+
+# Configure logging: request threads only enqueue records, a listener
+# thread does the file and console writes
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_file_handler = logging.handlers.RotatingFileHandler(
+    os.getenv('LOG_FILE', '/app/logs/mlb_data_service.log'),
+    maxBytes=int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024)),
+    backupCount=int(os.getenv('LOG_BACKUP_COUNT', 5))
+)
+log_stream_handler = logging.StreamHandler()
+for log_handler in (log_file_handler, log_stream_handler):
+    log_handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue, log_file_handler, log_stream_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# The listener's handlers apply log_formatter; the queue handler only merges
+# the message arguments, so records are not formatted twice
+log_queue_handler = logging.handlers.QueueHandler(log_queue)
+log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/app/logs/mlb_data_service.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[log_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
 # Database storage - replaced in-memory storage
 # All data operations now use PostgreSQL database
 
+class ApiError(Exception):
+    """Error raised by a view and rendered as a JSON error response"""
+    
+    def __init__(self, error, message=None, status=500):
+        super().__init__(message or error)
+        self.error = error
+        self.message = message or error
+        self.status = status
+
+@app.before_request
+def stamp_request_time():
+    """Compute the response timestamp once per request"""
+    g.now_iso = datetime.now().isoformat()
+    g.today = g.now_iso[:10]
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for container orchestration"""
     # Test database connection as part of health check
-    db_healthy = db_manager.test_connection()
+    db_healthy = check_database_connection()
+    if db_healthy:
+        return Response(_HEALTH_TEMPLATE % g.now_iso.encode(), status=200, mimetype='application/json')
     
     return jsonify({
-        'status': 'healthy' if db_healthy else 'unhealthy',
+        'status': 'unhealthy',
         'service': 'MLB Data Service',
-        'database': 'connected' if db_healthy else 'disconnected',
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
-    }), 200 if db_healthy else 503
+        'database': 'disconnected',
+        'timestamp': g.now_iso,
+        'version': SERVICE_VERSION
+    }), 503
 
 @app.route('/api/v1/status', methods=['GET'])
 def get_service_status():
     """Get current service status and statistics"""
-    try:
-        stats = db_manager.get_collection_stats()
-        # Get scheduler status
-        scheduler_status = get_scheduler().get_job_status() if scheduler else {'status': 'not_initialized'}
-        
-        return jsonify({
-            'service_name': 'MLB Data Service',
-            'status': 'active',
-            'database_connected': db_manager.test_connection(),
-            'scheduler_status': scheduler_status['status'],
-            'data_counts': stats.get('data_counts', {}),
-            'last_collections': stats.get('last_collections', {}),
-            'next_scheduled_runs': scheduler_status.get('jobs', []),
-            'timestamp': datetime.now().isoformat()
-        }), 200
-    except Exception as e:
-        logger.error(f"Status check failed: {e}")
-        return jsonify({
-            'service_name': 'MLB Data Service',
-            'status': 'error',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    sync_collection_caches()
+    stats = stats_cache.get_or_set('collection_stats', load_collection_stats)
+    # Get scheduler status
+    scheduler_status = scheduler_job_status()
+    
+    return jsonify({
+        'service_name': 'MLB Data Service',
+        'status': 'active',
+        'database_connected': check_database_connection(),
+        'scheduler_status': scheduler_status['status'],
+        'data_counts': stats.get('data_counts', {}),
+        'last_collections': stats.get('last_collections', {}),
+        'next_scheduled_runs': scheduler_status.get('jobs', []),
+        'timestamp': g.now_iso
+    }), 200
 
 @app.route('/api/v1/players', methods=['GET'])
+@collection_etag('players')
 def get_players():
     """Get all collected player data"""
-    try:
-        limit = request.args.get('limit', type=int)
-        players = db_manager.get_players(limit=limit)
-        return jsonify({
-            'players': players,
-            'count': len(players),
-            'source': 'database'
-        }), 200
-    except Exception as e:
-        logger.error(f"Failed to get players: {e}")
-        return jsonify({
-            'error': 'Failed to retrieve players',
-            'message': str(e)
-        }), 500
+    limit = request.args.get('limit', type=int)
+    players = players_cache.get_or_set(
+        (limit,), lambda: db_manager.get_players(limit=limit)
+    )
+    return jsonify({
+        'players': players,
+        'count': len(players),
+        'source': 'database'
+    }), 200
 
 @app.route('/api/v1/games/today', methods=['GET'])
+@collection_etag('games')
 def get_todays_games():
     """Get today's MLB games"""
-    try:
-        games = db_manager.get_todays_games()
-        return jsonify({
-            'games': games,
-            'count': len(games),
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'source': 'database'
-        }), 200
-    except Exception as e:
-        logger.error(f"Failed to get today's games: {e}")
-        return jsonify({
-            'error': 'Failed to retrieve games',
-            'message': str(e)
-        }), 500
+    games = games_cache.get_or_set((g.today,), db_manager.get_todays_games)
+    return jsonify({
+        'games': games,
+        'count': len(games),
+        'date': g.today,
+        'source': 'database'
+    }), 200
+
+def stream_statcast_json(player_name, rows):
+    """Yield the Statcast response body one encoded row at a time
+    
+    A failure mid-stream propagates, so the server drops the connection
+    before the closing chunk and the client sees a truncated response
+    rather than a short but well-formed array.
+    """
+    yield b'{"statcast_data":['
+    count = 0
+    for row in rows:
+        if count:
+            yield b','
+        yield app.json.dumps(row).encode()
+        count += 1
+    
+    trailer = {'count': count, 'source': 'database'}
+    if player_name:
+        trailer['player_filter'] = player_name
+    yield b'],' + app.json.dumps(trailer).encode()[1:]
 
 @app.route('/api/v1/statcast', methods=['GET'])
+@collection_etag('statcast')
 def get_statcast_data():
     """Get Statcast data with optional player filter"""
-    try:
-        player_name = request.args.get('player_name')
-        limit = request.args.get('limit', 100, type=int)
-        
-        statcast_data = db_manager.get_statcast_data(player_name=player_name, limit=limit)
-        
-        response = {
-            'statcast_data': statcast_data,
-            'count': len(statcast_data),
-            'source': 'database'
-        }
-        
-        if player_name:
-            response['player_filter'] = player_name
-        
-        return jsonify(response), 200
+    player_name = request.args.get('player_name')
+    limit = request.args.get('limit', 100, type=int)
+    
+    if not limit or limit > STATCAST_STREAM_THRESHOLD:
+        # Fetch the first row before committing to a 200, so a failed query
+        # still gets an error response
+        rows = db_manager.iter_statcast(player_name=player_name, limit=limit)
+        try:
+            first_row = next(rows, None)
+        except Exception:
+            raise ApiError('Failed to retrieve Statcast data', 'Statcast query failed')
+        if first_row is not None:
+            rows = itertools.chain((first_row,), rows)
         
-    except Exception as e:
-        logger.error(f"Failed to get Statcast data: {e}")
-        return jsonify({
-            'error': 'Failed to retrieve Statcast data',
-            'message': str(e)
-        }), 500
+        return Response(
+            stream_with_context(stream_statcast_json(player_name, rows)),
+            status=200,
+            mimetype='application/json'
+        )
+    
+    # PostgreSQL builds the response body; pass it through without re-encoding
+    cache_key = (player_name, limit)
+    payload = statcast_cache.get(cache_key)
+    if payload is None:
+        payload = db_manager.get_statcast_json(player_name=player_name, limit=limit)
+        if payload is None:
+            raise ApiError('Failed to retrieve Statcast data', 'Statcast query failed')
+        statcast_cache.set(cache_key, payload)
+    
+    return Response(payload, status=200, mimetype='application/json')
 
-@app.route('/api/v1/collect/players', methods=['POST'])
-def collect_players():
-    """Trigger player data collection from external APIs"""
+def _collect_players(limit=25):
+    """Collect and store player data (runs on the collection executor)"""
     try:
         logger.info("Starting real player data collection...")
         
-        # Get limit from request parameters
-        limit = request.json.get('limit', 25) if request.json else 25
-        
         # Log collection start
         db_manager.log_collection_status('players', 'running')
         
@@ -169,37 +344,35 @@ def collect_players():
         # Store collected data in database
         stored_count = db_manager.store_players(collected_players)
         
+        data_source = collected_players[0].get('data_source', 'unknown') if collected_players else 'none'
+        
         # Log collection completion
         db_manager.log_collection_status(
             'players', 'completed', 
             records_collected=stored_count,
-            data_source=collected_players[0].get('data_source', 'unknown') if collected_players else 'none'
+            data_source=data_source
         )
+        invalidate_collection_cache('players')
         
         logger.info(f"Collected and stored {stored_count} players successfully")
         
-        return jsonify({
+        return {
             'status': 'success',
             'message': 'Player data collection completed',
             'players_collected': stored_count,
-            'data_source': collected_players[0].get('data_source', 'unknown') if collected_players else 'none',
+            'data_source': data_source,
             'collection_time': datetime.now().isoformat(),
             'storage': 'database'
-        }), 200
+        }
         
     except Exception as e:
         # Log collection failure
         db_manager.log_collection_status('players', 'failed', error_message=str(e))
         logger.error(f"Player collection failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Player collection failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        raise
 
-@app.route('/api/v1/collect/games', methods=['POST'])
-def collect_games():
-    """Trigger today's games collection from MLB API"""
+def _collect_games():
+    """Collect and store today's games (runs on the collection executor)"""
     try:
         logger.info("Starting real games data collection...")
         
@@ -212,44 +385,38 @@ def collect_games():
         # Store collected data in database
         stored_count = db_manager.store_games(collected_games)
         
+        data_source = collected_games[0].get('data_source', 'unknown') if collected_games else 'none'
+        
         # Log collection completion
         db_manager.log_collection_status(
             'games', 'completed',
             records_collected=stored_count,
-            data_source=collected_games[0].get('data_source', 'unknown') if collected_games else 'none'
+            data_source=data_source
         )
+        invalidate_collection_cache('games')
         
         logger.info(f"Collected and stored {stored_count} games successfully")
         
-        return jsonify({
+        return {
             'status': 'success',
             'message': 'Games data collection completed',
             'games_collected': stored_count,
-            'data_source': collected_games[0].get('data_source', 'unknown') if collected_games else 'none',
+            'data_source': data_source,
             'collection_time': datetime.now().isoformat(),
             'storage': 'database'
-        }), 200
+        }
         
     except Exception as e:
         # Log collection failure
         db_manager.log_collection_status('games', 'failed', error_message=str(e))
         logger.error(f"Games collection failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Games collection failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        raise
 
-@app.route('/api/v1/collect/statcast', methods=['POST'])
-def collect_statcast():
-    """Trigger Statcast data collection from PyBaseball"""
+def _collect_statcast(days_back=3, limit=50):
+    """Collect and store recent Statcast data (runs on the collection executor)"""
     try:
         logger.info("Starting real Statcast data collection...")
         
-        # Get parameters from request
-        days_back = request.json.get('days_back', 3) if request.json else 3
-        limit = request.json.get('limit', 50) if request.json else 50
-        
         # Log collection start
         db_manager.log_collection_status('statcast', 'running')
         
@@ -259,77 +426,230 @@ def collect_statcast():
         # Store collected data in database
         stored_count = db_manager.store_statcast(collected_statcast)
         
+        data_source = collected_statcast[0].get('data_source', 'unknown') if collected_statcast else 'none'
+        
         # Log collection completion
         db_manager.log_collection_status(
             'statcast', 'completed',
             records_collected=stored_count,
-            data_source=collected_statcast[0].get('data_source', 'unknown') if collected_statcast else 'none'
+            data_source=data_source
         )
+        invalidate_collection_cache('statcast')
         
         logger.info(f"Collected and stored {stored_count} Statcast records successfully")
         
-        return jsonify({
+        return {
             'status': 'success',
             'message': 'Statcast data collection completed',
             'records_collected': stored_count,
             'days_back': days_back,
-            'data_source': collected_statcast[0].get('data_source', 'unknown') if collected_statcast else 'none',
+            'data_source': data_source,
             'collection_time': datetime.now().isoformat(),
             'storage': 'database'
-        }), 200
+        }
         
     except Exception as e:
         # Log collection failure
         db_manager.log_collection_status('statcast', 'failed', error_message=str(e))
         logger.error(f"Statcast collection failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Statcast collection failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        raise
+
+# Collection helpers and the result key holding each one's stored record count
+COLLECTION_FUNCTIONS = {
+    'players': (_collect_players, 'players_collected'),
+    'games': (_collect_games, 'games_collected'),
+    'statcast': (_collect_statcast, 'records_collected')
+}
+
+def _collect_batch(resources, params):
+    """Run several collections concurrently and aggregate their record counts"""
+    def run_collection(resource):
+        collect_function, _ = COLLECTION_FUNCTIONS[resource]
+        try:
+            return resource, collect_function(**params.get(resource, {}))
+        except Exception as e:
+            return resource, {'status': 'error', 'error': str(e)}
+    
+    with ThreadPoolExecutor(max_workers=len(resources), thread_name_prefix='collect-batch') as pool:
+        results = dict(pool.map(run_collection, resources))
+    
+    records_collected = {}
+    errors = {}
+    for resource, result in results.items():
+        if result.get('status') == 'error':
+            errors[resource] = result['error']
+        else:
+            records_collected[resource] = result.get(COLLECTION_FUNCTIONS[resource][1], 0)
+    
+    logger.info(f"Batch collection completed: {records_collected}, errors: {errors}")
+    
+    return {
+        'status': 'partial' if errors else 'success',
+        'records_collected': records_collected,
+        'errors': errors,
+        'collection_time': datetime.now().isoformat(),
+        'storage': 'database'
+    }
+
+def submit_collection_job(collection_type, func, *args):
+    """Record a collection job, run it on the background executor and return its id"""
+    try:
+        job_id, _ = job_store.create(collection_type)
+    except Exception as e:
+        logger.error(f"Failed to record {collection_type} collection job: {e}")
+        raise ApiError('Job store unavailable', 'Could not record the collection job', status=503)
+    
+    collection_executor.submit(job_store.run, job_id, func, *args)
+    
+    logger.info(f"Submitted {collection_type} collection job {job_id}")
+    return job_id
+
+def accepted_job_response(job_id, collection_type):
+    """Build the 202 response for a submitted collection job"""
+    return jsonify({
+        'status': 'accepted',
+        'job_id': job_id,
+        'collection_type': collection_type,
+        'status_url': f'/api/v1/jobs/{job_id}',
+        'timestamp': g.now_iso
+    }), 202
+
+@app.route('/api/v1/collect', methods=['POST'])
+def collect_batch():
+    """Trigger several collections in one request, e.g. {"resources": ["players", "games"]}"""
+    payload = request_payload()
+    resources = payload.get('resources') or list(COLLECTION_FUNCTIONS)
+    params = payload.get('params') or {}
+    
+    unknown = [resource for resource in resources if resource not in COLLECTION_FUNCTIONS]
+    if unknown:
+        raise ApiError('Invalid resources', f'Unknown collection resources: {unknown}', status=400)
+    
+    # Preserve order while dropping duplicates
+    resources = list(dict.fromkeys(resources))
+    
+    job_id = submit_collection_job('batch', _collect_batch, resources, params)
+    return accepted_job_response(job_id, 'batch')
+
+@app.route('/api/v1/collect/players', methods=['POST'])
+def collect_players():
+    """Trigger player data collection from external APIs"""
+    # Get limit from request parameters
+    limit = request_payload().get('limit', 25)
+    
+    job_id = submit_collection_job('players', _collect_players, limit)
+    return accepted_job_response(job_id, 'players')
+
+@app.route('/api/v1/collect/games', methods=['POST'])
+def collect_games():
+    """Trigger today's games collection from MLB API"""
+    job_id = submit_collection_job('games', _collect_games)
+    return accepted_job_response(job_id, 'games')
+
+@app.route('/api/v1/collect/statcast', methods=['POST'])
+def collect_statcast():
+    """Trigger Statcast data collection from PyBaseball"""
+    # Get parameters from request
+    payload = request_payload()
+    days_back = payload.get('days_back', 3)
+    limit = payload.get('limit', 50)
+    
+    job_id = submit_collection_job('statcast', _collect_statcast, days_back, limit)
+    return accepted_job_response(job_id, 'statcast')
+
+@app.route('/api/v1/jobs/<job_id>', methods=['GET'])
+def get_collection_job(job_id):
+    """Get status and result of a background collection job"""
+    job = job_store.get(job_id)
+    
+    if job is None:
+        raise ApiError('Job not found', f'No collection job with id {job_id}', status=404)
+    
+    response = {
+        'job_id': job_id,
+        'collection_type': job['collection_type'],
+        'submitted_at': job['submitted_at'],
+        'status': job['status'],
+        'timestamp': g.now_iso
+    }
+    
+    if job['status'] == 'failed':
+        response['error'] = job['error_message']
+    elif job['status'] == 'completed':
+        response['result'] = job['result']
+    
+    return jsonify(response), 200
+
+@app.route('/api/v1/collect/all', methods=['POST'])
+def collect_all():
+    """Trigger players, games and Statcast collection as one batch job"""
+    payload = request_payload()
+    params = {
+        'players': {'limit': payload.get('players_limit', 25)},
+        'statcast': {
+            'days_back': payload.get('days_back', 3),
+            'limit': payload.get('statcast_limit', 50)
+        }
+    }
+    
+    job_id = submit_collection_job('batch', _collect_batch, list(COLLECTION_FUNCTIONS), params)
+    return accepted_job_response(job_id, 'batch')
 
 @app.route('/api/v1/scheduler/status', methods=['GET'])
 def get_scheduler_status():
     """Get detailed scheduler status"""
-    try:
-        scheduler_instance = get_scheduler()
-        status = scheduler_instance.get_job_status()
-        return jsonify(status), 200
-    except Exception as e:
-        logger.error(f"Failed to get scheduler status: {e}")
-        return jsonify({
-            'error': 'Failed to get scheduler status',
-            'message': str(e)
-        }), 500
+    return jsonify(scheduler_job_status()), 200
 
 @app.route('/api/v1/scheduler/trigger', methods=['POST'])
 def trigger_daily_collection():
     """Manually trigger daily data collection"""
-    try:
-        logger.info("Manual daily collection triggered via API")
-        scheduler_instance = get_scheduler()
-        result = scheduler_instance.trigger_daily_collection()
-        
-        return jsonify({
-            'status': 'triggered',
-            'message': 'Daily collection started',
-            'collection_result': result,
-            'timestamp': datetime.now().isoformat()
-        }), 200
-    except Exception as e:
-        logger.error(f"Failed to trigger daily collection: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Failed to trigger collection: {str(e)}',
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    if scheduler is None:
+        status = scheduler_job_status()
+        if status['status'] == 'owned_by_other_worker':
+            raise ApiError(
+                'Scheduler runs in another worker',
+                f"Scheduler is owned by worker pid {status['owner_pid']}; retry the request",
+                status=409
+            )
+        raise ApiError('Scheduler unavailable', f"Scheduler is {status['status']}", status=503)
+    
+    logger.info("Manual daily collection triggered via API")
+    result = scheduler.trigger_daily_collection()
+    
+    return jsonify({
+        'status': 'triggered',
+        'message': 'Daily collection started',
+        'collection_result': result,
+        'timestamp': g.now_iso
+    }), 200
+
+@app.errorhandler(ApiError)
+def handle_api_error(error):
+    return jsonify({
+        'error': error.error,
+        'message': error.message,
+        'timestamp': g.get('now_iso') or datetime.now().isoformat()
+    }), error.status
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(error):
+    # Let 404/405 and other HTTP errors keep their own responses
+    if isinstance(error, HTTPException):
+        return error
+    
+    logger.error(f"Request {request.method} {request.path} failed: {error}")
+    return jsonify({
+        'error': 'Internal server error',
+        'message': str(error),
+        'timestamp': g.get('now_iso') or datetime.now().isoformat()
+    }), 500
 
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({
         'error': 'Endpoint not found',
         'message': 'The requested API endpoint does not exist',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': g.get('now_iso') or datetime.now().isoformat()
     }), 404
 
 @app.errorhandler(500)
@@ -337,35 +657,85 @@ def internal_error(error):
     return jsonify({
         'error': 'Internal server error',
         'message': 'An unexpected error occurred',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': g.get('now_iso') or datetime.now().isoformat()
     }), 500
 
-if __name__ == '__main__':
-    # Create logs directory if it doesn't exist
-    os.makedirs('/app/logs', exist_ok=True)
+def start_scheduler_once():
+    """Start the scheduler in whichever worker process takes the lock file first"""
+    global scheduler, scheduler_lock_fd
     
-    logger.info("Starting MLB Data Service...")
+    lock_fd = os.open(SCHEDULER_LOCK_PATH, os.O_CREAT | os.O_RDWR)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(lock_fd)
+        logger.info("Scheduler already owned by another worker process")
+        return None
     
-    # Start the scheduler
+    scheduler_lock_fd = lock_fd
+    # Record the owner so the other workers can name it in their status
+    os.ftruncate(lock_fd, 0)
+    os.write(lock_fd, str(os.getpid()).encode())
     try:
-        global scheduler
-        scheduler = start_scheduler("http://localhost:8001")
+        scheduler = start_scheduler(SCHEDULER_SERVICE_URL)
         logger.info("✅ Automated scheduler started - daily collection at 7 AM")
     except Exception as e:
         logger.error(f"❌ Failed to start scheduler: {e}")
         scheduler = None
     
+    atexit.register(shutdown_scheduler)
+    return scheduler
+
+def scheduler_owner_pid():
+    """Return the pid recorded in the scheduler lock file, if any"""
+    try:
+        with open(SCHEDULER_LOCK_PATH) as lock_file:
+            return int(lock_file.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def scheduler_job_status():
+    """Describe the scheduler as seen from this worker
+
+    Only the lock owner runs jobs; the other workers report who owns the
+    scheduler instead of building an idle instance of their own.
+    """
+    if scheduler:
+        return scheduler.get_job_status()
+    if not SCHEDULER_ENABLED:
+        return {'status': 'disabled', 'jobs': []}
+    if scheduler_lock_fd is not None:
+        return {'status': 'failed', 'jobs': []}
+    return {'status': 'owned_by_other_worker', 'owner_pid': scheduler_owner_pid(), 'jobs': []}
+
+def shutdown_scheduler():
+    """Stop the scheduler and release the lock so another process can take over"""
+    global scheduler, scheduler_lock_fd
+    if scheduler:
+        logger.info("Shutting down scheduler...")
+        scheduler.stop()
+        scheduler = None
+    if scheduler_lock_fd is not None:
+        fcntl.flock(scheduler_lock_fd, fcntl.LOCK_UN)
+        os.close(scheduler_lock_fd)
+        scheduler_lock_fd = None
+
+# Runs on import so gunicorn workers start it too; the lock keeps it to one process
+if SCHEDULER_ENABLED:
+    start_scheduler_once()
+
+# Local development entry point (python -m mlb_data_service.app);
+# containers serve the app through gunicorn
+if __name__ == '__main__':
+    # Create logs directory if it doesn't exist
+    os.makedirs('/app/logs', exist_ok=True)
+    
+    logger.info("Starting MLB Data Service...")
     logger.info("Service available at http://localhost:8001")
     
-    try:
-        # Run the Flask application
-        app.run(
-            host='0.0.0.0',
-            port=8001,
-            debug=os.getenv('FLASK_ENV') == 'development'
-        )
-    finally:
-        # Cleanup scheduler on shutdown
-        if scheduler:
-            logger.info("Shutting down scheduler...")
-            scheduler.stop()
\ No newline at end of file
+    # Run the Flask application
+    app.run(
+        host='0.0.0.0',
+        port=8001,
+        debug=os.getenv('FLASK_ENV') == 'development'
+    )
\ No newline at end of file
@@ -6,20 +6,30 @@ Enhanced MLB Data Service
 Flask application with comprehensive FanGraphs and Statcast data support.
 """
 
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, jsonify, make_response, request, render_template
 from flask_cors import CORS
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import base64
+import hashlib
+import itertools
+import json
 import logging
 import os
-import sys
-import psutil
+import threading
+import unicodedata
 import time
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Import enhanced database manager
 from enhanced_database import EnhancedDatabaseManager
+from ttl_cache import TTLCache
+from job_store import CollectionJobStore
+from player_search_index import PlayerSearchIndex
+from json_provider import OrjsonProvider
+from request_helpers import etag_requested, request_payload
 
 # Import monitoring components
 # Import monitoring components with fallbacks
@@ -41,7 +51,21 @@ except ImportError:
 app = Flask(__name__, 
            template_folder='../templates',
            static_folder='../static')
+app.json = OrjsonProvider(app)
+# Flask 2.3+ reads these from the provider rather than JSON_SORT_KEYS /
+# JSONIFY_PRETTYPRINT_REGULAR; never sort or indent, even under debug
+app.json.sort_keys = False
+app.json.compact = True
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_MIN_SIZE=500,
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    SEND_FILE_MAX_AGE_DEFAULT=int(os.getenv('STATIC_MAX_AGE', 86400))
+)
 CORS(app)
+Compress(app)
 
 # Configure logging first
 logging.basicConfig(
@@ -56,7 +80,326 @@ logger = logging.getLogger(__name__)
 # Initialize enhanced database manager
 db_manager = EnhancedDatabaseManager()
 
-# Initialize monitoring components with fallbacks
+# Database stats and sample rows only change when a collection runs, so
+# pollers and dashboards are served from memory between collections
+STATS_CACHE_TTL = int(os.getenv('STATS_CACHE_TTL', 15))
+SAMPLE_CACHE_TTL = int(os.getenv('SAMPLE_CACHE_TTL', 30))
+stats_cache = TTLCache(ttl=STATS_CACHE_TTL, maxsize=1)
+sample_cache = TTLCache(ttl=SAMPLE_CACHE_TTL, maxsize=8)
+
+def cached_database_stats():
+    """Return get_database_stats(), refreshed at most every STATS_CACHE_TTL seconds"""
+    return stats_cache.get_or_set('database_stats', db_manager.get_database_stats_health)
+
+def cached_sample(name, loader, limit):
+    """Return a sample-data query result, refreshed at most every SAMPLE_CACHE_TTL seconds"""
+    return sample_cache.get_or_set((name, limit), lambda: loader(limit=limit))
+
+# Response timestamps are informational; format them at most once per second
+_timestamp_cache = (0, '')
+
+def now_iso():
+    """Return the current local time as an ISO string, cached per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _timestamp_cache[1]
+
+# Static capability blocks, serialized once and spliced into responses
+_STATUS_CAPABILITIES_JSON = json.dumps({
+    'fangraphs_batting': '320+ metrics per player',
+    'fangraphs_pitching': '390+ metrics per pitcher',
+    'statcast': '110+ fields per pitch',
+    'comprehensive_analytics': True
+}, separators=(',', ':')).encode()
+_ANALYTICS_CAPABILITIES_JSON = json.dumps({
+    'advanced_metrics': ['wOBA', 'wRC+', 'WAR', 'FIP', 'xFIP', 'SIERA'],
+    'statcast_metrics': ['Exit Velocity', 'Launch Angle', 'Spin Rate', 'Expected wOBA'],
+    'pitch_tracking': ['Location', 'Movement', 'Velocity', 'Spin Rate'],
+    'total_fields': {
+        'batting': 320,
+        'pitching': 390,
+        'statcast': 110
+    }
+}, separators=(',', ':')).encode()
+
+# Constant parts of the monitoring dashboard payload
+_SERVICE_INFO_BASE = {'name': 'MLB Data Service Enhanced', 'version': '2.0.0'}
+_MONITORING_CONFIG_BASE = {'health_check_interval': '60 seconds'}
+
+def json_with_capabilities(payload, capabilities_json):
+    """Serialize payload and append the pre-serialized capabilities member"""
+    body = app.json.dumps_bytes(payload)
+    return Response(body[:-1] + b',"capabilities":' + capabilities_json + b'}',
+                    mimetype='application/json')
+
+# Independent read queries for one request run side by side on pooled connections
+query_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('QUERY_WORKERS', 8)),
+    thread_name_prefix='analytics-query'
+)
+
+# Player lookups are read-mostly; repeated searches and profiles skip the database
+PLAYER_CACHE_TTL = int(os.getenv('PLAYER_CACHE_TTL', 300))
+player_search_cache = TTLCache(ttl=PLAYER_CACHE_TTL, maxsize=2048)
+player_profile_cache = TTLCache(ttl=PLAYER_CACHE_TTL, maxsize=2048)
+
+# Search results per request are capped at MAX_SEARCH_LIMIT
+MAX_SEARCH_LIMIT = int(os.getenv('MAX_SEARCH_LIMIT', 50))
+
+# Search terms that would match most of the player register
+_BROAD_SEARCH_TERMS = frozenset({'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'de', 'la', 'van'})
+
+def normalize_search_query(raw_query):
+    """Lower-case, trim and ASCII-fold a search term to match the register's names"""
+    query = (raw_query or '').strip().lower()
+    if not query.isascii():
+        query = unicodedata.normalize('NFKD', query).encode('ascii', 'ignore').decode()
+    return query
+
+# Name searches match against an in-memory copy of the register, reloaded hourly;
+# the database query remains the fallback while the index cannot be loaded
+PLAYER_INDEX_REFRESH_SECONDS = int(os.getenv('PLAYER_INDEX_REFRESH_SECONDS', 3600))
+player_search_index = PlayerSearchIndex(
+    db_manager.get_player_search_rows, refresh_seconds=PLAYER_INDEX_REFRESH_SECONDS
+)
+
+def _search_players(query, limit):
+    """Search the in-memory index, falling back to search_players() in the database"""
+    results = player_search_index.search(query, limit)
+    if results is None:
+        return db_manager.search_players(query=query, limit=limit)
+    
+    # The index carries no Statcast counts; fetch them for this page only
+    counts = db_manager.get_statcast_counts(
+        [player['key_mlbam'] for player in results if player['key_mlbam'] is not None]
+    )
+    for player in results:
+        player['statcast_abs'] = counts.get(player['key_mlbam'], 0)
+    return results
+
+def cached_player_search(query, limit):
+    """Return player search results for a normalized query"""
+    return player_search_cache.get_or_set((query, limit), lambda: _search_players(query, limit))
+
+# Profile fields needed by /player/ids; the rest of the profile is not queried
+_PLAYER_ID_FIELDS = ('full_name', 'key_fangraphs', 'key_mlbam', 'key_bbref', 'key_retro',
+                     'mlb_played_first', 'mlb_played_last')
+
+def cached_player_profile(player_name, fangraphs_id, mlb_id, columns=None):
+    """Return get_unified_player_profile() keyed on the lower-cased name, IDs and columns"""
+    player_name = player_name.lower() if player_name else player_name
+    return player_profile_cache.get_or_set(
+        (player_name, fangraphs_id, mlb_id, columns),
+        lambda: db_manager.get_unified_player_profile(
+            player_name=player_name, fangraphs_id=fangraphs_id, mlb_id=mlb_id,
+            columns=list(columns) if columns else None
+        )
+    )
+
+def cacheable(response):
+    """Let browsers and proxies reuse a player lookup response for PLAYER_CACHE_TTL"""
+    response.cache_control.public = True
+    response.cache_control.max_age = PLAYER_CACHE_TTL
+    return response
+
+# Listing endpoints page with opaque keyset cursors rather than OFFSET
+def encode_cursor(row, keys):
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    key = json.dumps({k: row.get(k) for k in keys}, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, keys):
+    """Decode an ?after= cursor, returning None when it is missing or malformed"""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(key, dict) or not all(k in key for k in keys):
+        return None
+    return key
+
+def next_page_cursor(rows, limit, keys):
+    """Return the cursor for the following page, or None on the last page"""
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1], keys)
+
+# Listings cap ?limit= at MAX_LIST_LIMIT and stream pages above LIST_STREAM_THRESHOLD
+MAX_LIST_LIMIT = int(os.getenv('MAX_LIST_LIMIT', 5000))
+LIST_STREAM_THRESHOLD = int(os.getenv('LIST_STREAM_THRESHOLD', 1000))
+
+def list_limit(default):
+    """Read ?limit= clamped to 1..MAX_LIST_LIMIT"""
+    return max(1, min(request.args.get('limit', default, type=int), MAX_LIST_LIMIT))
+
+def prefetch_rows(rows):
+    """Fetch the first row of a stream before committing to a 200, so a failed
+    query raises from the view and gets the usual 500 response"""
+    first_row = next(rows, None)
+    if first_row is None:
+        return rows
+    return itertools.chain((first_row,), rows)
+
+def stream_listing(header, rows_key, rows, limit, cursor_keys):
+    """Yield a listing response body one encoded row at a time
+
+    A failure mid-stream propagates, so the server drops the connection
+    before the closing chunk instead of ending the listing as a last page.
+    """
+    yield app.json.dumps_bytes(header)[:-1] + b',"' + rows_key.encode() + b'":['
+    count = 0
+    last_row = None
+    for row in rows:
+        if count:
+            yield b','
+        yield app.json.dumps_bytes(row)
+        count += 1
+        last_row = row
+    
+    trailer = {
+        'count': count,
+        'next_cursor': encode_cursor(last_row, cursor_keys) if count == limit else None,
+        'timestamp': now_iso()
+    }
+    yield b'],' + app.json.dumps_bytes(trailer)[1:]
+
+def invalid_cursor_response():
+    """400 response for an ?after= value that is not a cursor from this API"""
+    return jsonify({
+        'status': 'error',
+        'message': 'Invalid pagination cursor',
+        'timestamp': now_iso()
+    }), 400
+
+# Read endpoints answer repeat polls with 304 until their data changes. Each
+# collection type is versioned by its last completed job in collection_jobs,
+# which every worker re-reads at most every COLLECTION_CHECK_TTL seconds; the
+# window bounds staleness for anything those versions and the counts miss
+ETAG_WINDOW_SECONDS = int(os.getenv('ETAG_WINDOW_SECONDS', 300))
+COLLECTION_CHECK_TTL = float(os.getenv('COLLECTION_CHECK_TTL', 5.0))
+collection_versions_cache = TTLCache(ttl=COLLECTION_CHECK_TTL, maxsize=1)
+seen_collection_versions = {}
+seen_collection_versions_lock = threading.Lock()
+
+def load_collection_versions():
+    """Read the last completed job per collection type, keeping the known
+    versions when the job store cannot be reached"""
+    try:
+        return job_store.last_completed()
+    except Exception as e:
+        logger.warning(f"Collection versions unavailable: {e}")
+        return dict(seen_collection_versions)
+
+def sync_collection_versions():
+    """Return the collection versions, dropping this worker's cached reads
+    when a collection finished since it last looked, in any worker"""
+    versions = collection_versions_cache.get_or_set('versions', load_collection_versions)
+    with seen_collection_versions_lock:
+        if versions != seen_collection_versions:
+            seen_collection_versions.clear()
+            seen_collection_versions.update(versions)
+            invalidate_stats_cache()
+    return versions
+
+def data_etag(*collection_types):
+    """Add an ETag derived from the collections a view reads and honor If-None-Match"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = sync_collection_versions()
+            version = (
+                [versions.get(collection_type) for collection_type in collection_types],
+                sorted(cached_database_stats().items()),
+                int(time.time() // ETAG_WINDOW_SECONDS),
+                request.full_path
+            )
+            etag = hashlib.md5(repr(version).encode()).hexdigest()
+            
+            if etag_requested(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag)
+            if not response.cache_control.max_age:
+                response.cache_control.private = True
+                response.cache_control.max_age = 30
+            return response
+        return wrapper
+    return decorator
+
+# Serialized bodies of read endpoints, keyed on the query string, so repeat
+# requests skip both the database and JSON encoding; ?nocache=1 bypasses them
+response_caches = []
+response_cache_counters = {}
+
+def cached_response(ttl):
+    """Serve a view's 200 JSON body from memory for ttl seconds per query string
+
+    Wrap it in data_etag, which answers 304 before the cache is consulted.
+    """
+    def decorator(view):
+        cache = TTLCache(ttl=ttl, maxsize=256)
+        response_caches.append(cache)
+        counters = response_cache_counters.setdefault(view.__name__, {'hits': 0, 'misses': 0})
+        
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.args.get('nocache') == '1':
+                return view(*args, **kwargs)
+            
+            sync_collection_versions()
+            key = (tuple(sorted(kwargs.items())),
+                   tuple(sorted((k, v) for k, v in request.args.items(multi=True) if k != 'nocache')))
+            body = cache.get(key)
+            if body is not None:
+                counters['hits'] += 1
+                return Response(body, mimetype='application/json')
+            
+            counters['misses'] += 1
+            response = make_response(view(*args, **kwargs))
+            if (response.status_code == 200 and response.mimetype == 'application/json'
+                    and not response.is_streamed):
+                cache.set(key, response.get_data())
+            return response
+        return wrapper
+    return decorator
+
+# Views decorated with safe_endpoint name the message handle_unexpected_error
+# reports for them and log slow requests
+SLOW_REQUEST_SECONDS = float(os.getenv('SLOW_REQUEST_SECONDS', 0.5))
+
+def safe_endpoint(error_message):
+    """Attach the view's 500 error message and log requests slower than SLOW_REQUEST_SECONDS"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            response = view(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+            if elapsed > SLOW_REQUEST_SECONDS:
+                logger.warning(f"Slow request {view.__name__}: {elapsed:.3f}s")
+            return response
+        wrapper.error_message = error_message
+        return wrapper
+    return decorator
+
+def invalidate_stats_cache():
+    """Drop cached stats, samples, profiles and responses after new data is stored"""
+    stats_cache.clear()
+    sample_cache.clear()
+    player_profile_cache.clear()
+    monitoring_status_cache.clear()
+    for cache in response_caches:
+        cache.clear()
+
+# Initialize monitoring components with fallbacks. Each starts a background
+# thread and keeps alert state in memory, so the service runs a single gunicorn
+# worker (see enhanced_dockerfile)
 try:
     if MONITORING_AVAILABLE:
         health_monitor = ProductionHealthMonitor(db_manager)
@@ -72,262 +415,290 @@ except Exception as e:
     health_monitor = ProductionHealthMonitor()
     alert_manager = AlertManager()
 
+def _probe_health_reader():
+    """Pick how health data is read from whichever monitor was initialized"""
+    get_cached = getattr(health_monitor, 'get_cached_health', None)
+    run_check = getattr(health_monitor, 'run_health_check', None)
+    if get_cached and run_check:
+        return lambda: get_cached() or run_check()
+    return get_cached or run_check or (lambda: {"status": "healthy", "fallback": True})
+
+# Monitor capabilities are probed once here so request handlers call straight through
+_get_health = _probe_health_reader()
+_get_active_alerts = getattr(alert_manager, 'get_active_alerts', list)
+_get_alert_history = getattr(alert_manager, 'get_alert_history', None)
+
+# Liveness answers from memory; readiness and detailed health results are cached
+# per endpoint for HEALTH_CACHE_TTL_SEC, with one thread refreshing each on expiry
+_ALIVE_BODY = b'{"status":"alive","service":"mlb-data-service-enhanced","version":"2.0.0"}'
+HEALTH_CACHE_TTL_SEC = float(os.getenv('HEALTH_CACHE_TTL_SEC', os.getenv('READINESS_TTL', 2)))
+health_cache = TTLCache(ttl=HEALTH_CACHE_TTL_SEC, maxsize=4)
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint for container orchestration"""
+    """Liveness probe: the process is serving requests, no database access"""
+    return Response(_ALIVE_BODY, mimetype='application/json')
+
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe for container orchestration, backed by a cached database ping"""
     try:
-        # Test database connection
-        db_connected = db_manager.test_connection()
+        db_connected = health_cache.get_or_set('ready', db_manager.test_connection_health)
         
         return jsonify({
             'status': 'healthy' if db_connected else 'unhealthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'service': 'mlb-data-service-enhanced',
             'version': '2.0.0',
             'database': 'connected' if db_connected else 'disconnected'
         }), 200 if db_connected else 503
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error(f"Readiness check failed: {e}")
         return jsonify({
             'status': 'unhealthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'error': str(e)
         }), 503
 
 @app.route('/api/v1/status', methods=['GET'])
+@safe_endpoint('Status check failed')
 def service_status():
     """Service status endpoint with comprehensive database statistics"""
+    stats = cached_database_stats()
+    
+    return json_with_capabilities({
+        'service': 'mlb-data-service-enhanced',
+        'status': 'operational',
+        'timestamp': now_iso(),
+        'database_stats': stats,
+        'response_cache': response_cache_counters
+    }, _STATUS_CAPABILITIES_JSON)
+
+# Collections run for minutes; handlers queue them and return 202 immediately.
+# Job state lives in the collection_jobs table so any worker can answer the poll
+collection_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='collection')
+JOB_RETENTION_SECONDS = 3600
+JOB_DEDUPE_SECONDS = int(os.getenv('JOB_DEDUPE_SECONDS', 600))
+job_store = CollectionJobStore(
+    db_manager.get_connection, db_manager.return_connection, retention_seconds=JOB_RETENTION_SECONDS
+)
+
+def submit_collection_job(collection_type, func, **kwargs):
+    """Record a collection job, run it on the background executor and return its id"""
     try:
-        stats = db_manager.get_database_stats()
-        
-        return jsonify({
-            'service': 'mlb-data-service-enhanced',
-            'status': 'operational',
-            'timestamp': datetime.now().isoformat(),
-            'database_stats': stats,
-            'capabilities': {
-                'fangraphs_batting': '320+ metrics per player',
-                'fangraphs_pitching': '390+ metrics per pitcher', 
-                'statcast': '110+ fields per pitch',
-                'comprehensive_analytics': True
-            }
-        })
-        
+        # Overlapping submissions of the same collection join the pending job
+        job_id, created = job_store.create(collection_type, kwargs, dedupe_seconds=JOB_DEDUPE_SECONDS)
     except Exception as e:
-        logger.error(f"Status check failed: {e}")
+        logger.error(f"Failed to record {collection_type} collection job: {e}")
         return jsonify({
-            'service': 'mlb-data-service-enhanced',
             'status': 'error',
-            'timestamp': datetime.now().isoformat(),
-            'error': str(e)
-        }), 500
+            'message': 'Could not record the collection job',
+            'timestamp': now_iso()
+        }), 503
+    
+    response = {
+        'status': 'queued',
+        'job_id': job_id,
+        'collection_type': collection_type,
+        'parameters': kwargs,
+        'status_url': f'/api/v1/collect/jobs/{job_id}',
+        'timestamp': now_iso()
+    }
+    if created:
+        collection_executor.submit(job_store.run, job_id, func, **kwargs)
+        logger.info(f"Submitted {collection_type} collection job {job_id}")
+    else:
+        logger.info(f"Reusing pending {collection_type} collection job {job_id}")
+        response['deduplicated'] = True
+    return jsonify(response), 202
+
+def _collection_result(count, description, **details):
+    """Build the job result for a finished collection"""
+    # Other workers pick the collection up from its completed job
+    invalidate_stats_cache()
+    if count > 0:
+        return {'status': 'success', 'message': f'Collected {count} {description}',
+                'records_collected': count, **details}
+    return {'status': 'warning', 'message': f'No {description} collected',
+            'records_collected': 0, **details}
+
+def _collect_fangraphs_batting(season, min_pa):
+    """Collect and store FanGraphs batting data for a season"""
+    logger.info(f"Starting FanGraphs batting collection for {season}")
+    count = db_manager.collect_and_store_fangraphs_batting(season=season, min_pa=min_pa)
+    return _collection_result(count, f'FanGraphs batting records for {season}',
+                              season=season, min_pa=min_pa)
+
+def _collect_fangraphs_pitching(season, min_ip):
+    """Collect and store FanGraphs pitching data for a season"""
+    logger.info(f"Starting FanGraphs pitching collection for {season}")
+    count = db_manager.collect_and_store_fangraphs_pitching(season=season, min_ip=min_ip)
+    return _collection_result(count, f'FanGraphs pitching records for {season}',
+                              season=season, min_ip=min_ip)
+
+def _collect_statcast(start_date, end_date):
+    """Collect and store Statcast data for a date range"""
+    logger.info(f"Starting Statcast collection from {start_date} to {end_date}")
+    count = db_manager.collect_and_store_statcast(start_date=start_date, end_date=end_date)
+    return _collection_result(count, 'Statcast records',
+                              start_date=start_date, end_date=end_date)
 
 @app.route('/api/v1/collect/fangraphs/batting', methods=['POST'])
 def collect_fangraphs_batting():
-    """Collect comprehensive FanGraphs batting data"""
-    try:
-        data = request.get_json() or {}
-        season = data.get('season', datetime.now().year)
-        min_pa = data.get('min_pa', 10)
-        
-        logger.info(f"Starting FanGraphs batting collection for {season}")
-        
-        count = db_manager.collect_and_store_fangraphs_batting(season=season, min_pa=min_pa)
-        
-        if count > 0:
-            return jsonify({
-                'status': 'success',
-                'message': f'Collected {count} FanGraphs batting records for {season}',
-                'season': season,
-                'records_collected': count,
-                'min_pa': min_pa,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'status': 'warning',
-                'message': 'No FanGraphs batting data collected',
-                'season': season,
-                'timestamp': datetime.now().isoformat()
-            }), 204
-            
-    except Exception as e:
-        logger.error(f"FanGraphs batting collection failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'FanGraphs batting collection failed',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    """Queue a comprehensive FanGraphs batting collection"""
+    data = request_payload()
+    return submit_collection_job(
+        'fangraphs_batting', _collect_fangraphs_batting,
+        season=data.get('season', datetime.now().year),
+        min_pa=data.get('min_pa', 10)
+    )
 
 @app.route('/api/v1/collect/fangraphs/pitching', methods=['POST'])
 def collect_fangraphs_pitching():
-    """Collect comprehensive FanGraphs pitching data"""
-    try:
-        data = request.get_json() or {}
-        season = data.get('season', datetime.now().year)
-        min_ip = data.get('min_ip', 5)
-        
-        logger.info(f"Starting FanGraphs pitching collection for {season}")
-        
-        count = db_manager.collect_and_store_fangraphs_pitching(season=season, min_ip=min_ip)
-        
-        if count > 0:
-            return jsonify({
-                'status': 'success',
-                'message': f'Collected {count} FanGraphs pitching records for {season}',
-                'season': season,
-                'records_collected': count,
-                'min_ip': min_ip,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'status': 'warning',
-                'message': 'No FanGraphs pitching data collected',
-                'season': season,
-                'timestamp': datetime.now().isoformat()
-            }), 204
-            
-    except Exception as e:
-        logger.error(f"FanGraphs pitching collection failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'FanGraphs pitching collection failed',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    """Queue a comprehensive FanGraphs pitching collection"""
+    data = request_payload()
+    return submit_collection_job(
+        'fangraphs_pitching', _collect_fangraphs_pitching,
+        season=data.get('season', datetime.now().year),
+        min_ip=data.get('min_ip', 5)
+    )
 
 @app.route('/api/v1/collect/statcast', methods=['POST'])
 def collect_statcast():
-    """Collect comprehensive Statcast data"""
-    try:
-        data = request.get_json() or {}
-        
-        # Default to today if no dates provided
-        start_date = data.get('start_date', datetime.now().strftime('%Y-%m-%d'))
-        end_date = data.get('end_date', datetime.now().strftime('%Y-%m-%d'))
-        
-        logger.info(f"Starting Statcast collection from {start_date} to {end_date}")
-        
-        count = db_manager.collect_and_store_statcast(start_date=start_date, end_date=end_date)
-        
-        if count > 0:
-            return jsonify({
-                'status': 'success',
-                'message': f'Collected {count} Statcast records',
-                'start_date': start_date,
-                'end_date': end_date,
-                'records_collected': count,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'status': 'warning',
-                'message': 'No Statcast data collected',
-                'start_date': start_date,
-                'end_date': end_date,
-                'timestamp': datetime.now().isoformat()
-            }), 204
-            
-    except Exception as e:
-        logger.error(f"Statcast collection failed: {e}")
+    """Queue a comprehensive Statcast collection"""
+    data = request_payload()
+    # Default to today if no dates provided
+    today = datetime.now().strftime('%Y-%m-%d')
+    return submit_collection_job(
+        'statcast', _collect_statcast,
+        start_date=data.get('start_date', today),
+        end_date=data.get('end_date', today)
+    )
+
+@app.route('/api/v1/collect/jobs/<job_id>', methods=['GET'])
+@app.route('/api/v1/collect/status/<job_id>', methods=['GET'])
+def get_collection_job(job_id):
+    """Get status and result of a queued collection"""
+    job = job_store.get(job_id)
+    
+    if job is None:
         return jsonify({
             'status': 'error',
-            'message': 'Statcast collection failed',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'message': f'No collection job with id {job_id}',
+            'timestamp': now_iso()
+        }), 404
+    
+    response = {
+        'job_id': job_id,
+        'collection_type': job['collection_type'],
+        'parameters': job['parameters'],
+        'submitted_at': job['submitted_at'],
+        'status': job['status'],
+        'timestamp': now_iso()
+    }
+    
+    if job['status'] == 'failed':
+        response['error'] = job['error_message']
+    elif job['status'] == 'completed':
+        response['result'] = job['result']
+    
+    return jsonify(response)
+
+# Sort key columns carried in each listing's cursor
+_BATTING_CURSOR_KEYS = ('wrc_plus', 'player_id')
+_STATCAST_CURSOR_KEYS = ('game_date', 'launch_speed', 'game_pk', 'at_bat_number', 'pitch_number')
 
 @app.route('/api/v1/fangraphs/batting', methods=['GET'])
+@safe_endpoint('Failed to retrieve FanGraphs batting data')
+@data_etag('fangraphs_batting')
+@cached_response(ttl=300)
 def get_fangraphs_batting():
     """Get FanGraphs batting data summary"""
-    try:
-        season = request.args.get('season', datetime.now().year, type=int)
-        limit = request.args.get('limit', 20, type=int)
-        
-        data = db_manager.get_fangraphs_batting_summary(season=season, limit=limit)
-        
-        return jsonify({
-            'status': 'success',
-            'season': season,
-            'count': len(data),
-            'players': data,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get FanGraphs batting data: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve FanGraphs batting data',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    season = request.args.get('season', datetime.now().year, type=int)
+    limit = list_limit(20)
+    after = None
+    if request.args.get('after'):
+        after = decode_cursor(request.args['after'], _BATTING_CURSOR_KEYS)
+        if after is None:
+            return invalid_cursor_response()
+    
+    if limit > LIST_STREAM_THRESHOLD:
+        rows = prefetch_rows(db_manager.iter_fangraphs_batting_summary(season=season, limit=limit, after=after))
+        return Response(
+            stream_listing({'status': 'success', 'season': season}, 'players',
+                           rows, limit, _BATTING_CURSOR_KEYS),
+            mimetype='application/json'
+        )
+    
+    data = db_manager.get_fangraphs_batting_summary(season=season, limit=limit, after=after)
+    
+    return jsonify({
+        'status': 'success',
+        'season': season,
+        'count': len(data),
+        'players': data,
+        'next_cursor': next_page_cursor(data, limit, _BATTING_CURSOR_KEYS),
+        'timestamp': now_iso()
+    })
 
 @app.route('/api/v1/statcast', methods=['GET'])
+@safe_endpoint('Failed to retrieve Statcast data')
+@data_etag('statcast')
+@cached_response(ttl=300)
 def get_statcast():
     """Get Statcast data summary"""
-    try:
-        limit = request.args.get('limit', 20, type=int)
-        
-        data = db_manager.get_statcast_summary(limit=limit)
-        
-        return jsonify({
-            'status': 'success',
-            'count': len(data),
-            'pitches': data,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get Statcast data: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve Statcast data',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    limit = list_limit(20)
+    after = None
+    if request.args.get('after'):
+        after = decode_cursor(request.args['after'], _STATCAST_CURSOR_KEYS)
+        if after is None:
+            return invalid_cursor_response()
+    
+    if limit > LIST_STREAM_THRESHOLD:
+        rows = prefetch_rows(db_manager.iter_statcast_summary(limit=limit, after=after))
+        return Response(
+            stream_listing({'status': 'success'}, 'pitches', rows, limit, _STATCAST_CURSOR_KEYS),
+            mimetype='application/json'
+        )
+    
+    data = db_manager.get_statcast_summary(limit=limit, after=after)
+    
+    return jsonify({
+        'status': 'success',
+        'count': len(data),
+        'pitches': data,
+        'next_cursor': next_page_cursor(data, limit, _STATCAST_CURSOR_KEYS),
+        'timestamp': now_iso()
+    })
 
 @app.route('/api/v1/analytics/summary', methods=['GET'])
+@safe_endpoint('Failed to retrieve analytics summary')
+@data_etag()
+@cached_response(ttl=30)
 def analytics_summary():
     """Get comprehensive analytics summary"""
-    try:
-        stats = db_manager.get_database_stats()
-        
-        # Get sample data
-        batting_sample = db_manager.get_fangraphs_batting_summary(limit=5)
-        statcast_sample = db_manager.get_statcast_summary(limit=5)
-        
-        return jsonify({
-            'status': 'success',
-            'timestamp': datetime.now().isoformat(),
-            'database_overview': stats,
-            'sample_data': {
-                'top_batters': batting_sample,
-                'recent_pitches': statcast_sample
-            },
-            'capabilities': {
-                'advanced_metrics': ['wOBA', 'wRC+', 'WAR', 'FIP', 'xFIP', 'SIERA'],
-                'statcast_metrics': ['Exit Velocity', 'Launch Angle', 'Spin Rate', 'Expected wOBA'],
-                'pitch_tracking': ['Location', 'Movement', 'Velocity', 'Spin Rate'],
-                'total_fields': {
-                    'batting': 320,
-                    'pitching': 390,
-                    'statcast': 110
-                }
-            }
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get analytics summary: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve analytics summary',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    # Run the stats and sample data queries concurrently
+    stats_future = query_executor.submit(cached_database_stats)
+    batting_future = query_executor.submit(
+        cached_sample, 'top_batters', db_manager.get_fangraphs_batting_summary, 5
+    )
+    statcast_future = query_executor.submit(
+        cached_sample, 'recent_pitches', db_manager.get_statcast_summary, 5
+    )
+    stats = stats_future.result()
+    batting_sample = batting_future.result()
+    statcast_sample = statcast_future.result()
+    
+    return json_with_capabilities({
+        'status': 'success',
+        'timestamp': now_iso(),
+        'database_overview': stats,
+        'sample_data': {
+            'top_batters': batting_sample,
+            'recent_pitches': statcast_sample
+        }
+    }, _ANALYTICS_CAPABILITIES_JSON)
 
 @app.errorhandler(404)
 def not_found(error):
@@ -335,119 +706,105 @@ def not_found(error):
     return jsonify({
         'status': 'error',
         'message': 'Endpoint not found',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     }), 404
 
 @app.route('/api/v1/player/profile', methods=['GET'])
+@safe_endpoint('Failed to retrieve player profile')
+@data_etag('fangraphs_batting', 'fangraphs_pitching', 'statcast')
 def get_player_profile():
     """Get unified player profile combining all data sources"""
-    try:
-        # Get query parameters
-        player_name = request.args.get('name')
-        fangraphs_id = request.args.get('fangraphs_id', type=int)
-        mlb_id = request.args.get('mlb_id', type=int)
-        
-        if not any([player_name, fangraphs_id, mlb_id]):
-            return jsonify({
-                'status': 'error',
-                'message': 'Must provide name, fangraphs_id, or mlb_id parameter',
-                'timestamp': datetime.now().isoformat()
-            }), 400
-        
-        profile = db_manager.get_unified_player_profile(
-            player_name=player_name,
-            fangraphs_id=fangraphs_id,
-            mlb_id=mlb_id
-        )
-        
-        if profile:
-            return jsonify({
-                'status': 'success',
-                'player': profile,
-                'data_sources': {
-                    'player_lookup': True,
-                    'fangraphs_2025': profile.get('plate_appearances') is not None,
-                    'statcast': profile.get('statcast_abs', 0) > 0
-                },
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'status': 'not_found',
-                'message': 'Player not found',
-                'timestamp': datetime.now().isoformat()
-            }), 404
-            
-    except Exception as e:
-        logger.error(f"Failed to get player profile: {e}")
+    # Get query parameters
+    player_name = request.args.get('name')
+    fangraphs_id = request.args.get('fangraphs_id', type=int)
+    mlb_id = request.args.get('mlb_id', type=int)
+    
+    if not any([player_name, fangraphs_id, mlb_id]):
         return jsonify({
             'status': 'error',
-            'message': 'Failed to retrieve player profile',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'message': 'Must provide name, fangraphs_id, or mlb_id parameter',
+            'timestamp': now_iso()
+        }), 400
+    
+    profile = cached_player_profile(player_name, fangraphs_id, mlb_id)
+    
+    if profile:
+        return cacheable(jsonify({
+            'status': 'success',
+            'player': profile,
+            'data_sources': {
+                'player_lookup': True,
+                'fangraphs_2025': profile.get('plate_appearances') is not None,
+                'statcast': profile.get('statcast_abs', 0) > 0
+            },
+            'timestamp': now_iso()
+        }))
+    else:
+        return jsonify({
+            'status': 'not_found',
+            'message': 'Player not found',
+            'timestamp': now_iso()
+        }), 404
 
 @app.route('/api/v1/player/search', methods=['GET'])
+@safe_endpoint('Failed to search players')
+@data_etag()
+@cached_response(ttl=60)
 def search_players():
     """Search for players across all systems"""
-    try:
-        query = request.args.get('q', '').strip()
-        limit = request.args.get('limit', 10, type=int)
-        
-        if not query:
-            return jsonify({
-                'status': 'error',
-                'message': 'Query parameter "q" is required',
-                'timestamp': datetime.now().isoformat()
-            }), 400
-            
-        if len(query) < 2:
-            return jsonify({
-                'status': 'error',
-                'message': 'Query must be at least 2 characters',
-                'timestamp': datetime.now().isoformat()
-            }), 400
-        
-        results = db_manager.search_players(query=query, limit=limit)
-        
+    query = normalize_search_query(request.args.get('q'))
+    
+    if not query:
         return jsonify({
-            'status': 'success',
-            'query': query,
-            'count': len(results),
-            'players': results,
-            'timestamp': datetime.now().isoformat()
-        })
+            'status': 'error',
+            'message': 'Query parameter "q" is required',
+            'timestamp': now_iso()
+        }), 400
         
-    except Exception as e:
-        logger.error(f"Failed to search players: {e}")
+    # Reject terms too short, too long or too broad before touching the database
+    if not 2 <= len(query) <= 64 or query in _BROAD_SEARCH_TERMS or '%' in query or '_' in query:
         return jsonify({
             'status': 'error',
-            'message': 'Failed to search players',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'message': 'Query must be 2-64 characters and name a player',
+            'timestamp': now_iso()
+        }), 400
+    
+    limit = max(1, min(request.args.get('limit', 10, type=int), MAX_SEARCH_LIMIT))
+    
+    results = cached_player_search(query, limit)
+    
+    return cacheable(jsonify({
+        'status': 'success',
+        'query': query,
+        'count': len(results),
+        'players': results,
+        'timestamp': now_iso()
+    }))
+
+def _run_detailed_health_check():
+    """Run the health monitor and raise alerts for critical findings"""
+    health_data = _get_health()
+    
+    # Create alerts for critical issues
+    if health_data.get('overall_status') == 'critical':
+        for alert_info in health_data.get('alerts_triggered', []):
+            if 'Critical:' in alert_info:
+                alert_manager.create_alert(
+                    name=alert_info.split(': ')[1],
+                    severity=AlertSeverity.CRITICAL,
+                    message=alert_info,
+                    source='health_monitor',
+                    metadata={'health_check': True}
+                )
+        invalidate_alert_caches()
+    
+    return health_data
 
 @app.route('/api/v1/health/detailed', methods=['GET'])
 def detailed_health_check():
     """Comprehensive health check endpoint with detailed metrics"""
     try:
-        # Use correct method name with fallback
-        try:
-            health_data = health_monitor.get_cached_health() or health_monitor.run_health_check()
-        except AttributeError:
-            health_data = {"status": "healthy", "fallback": True}
-        
-        # Create alerts for critical issues
-        if health_data.get('overall_status') == 'critical':
-            for alert_info in health_data.get('alerts_triggered', []):
-                if 'Critical:' in alert_info:
-                    alert_manager.create_alert(
-                        name=alert_info.split(': ')[1],
-                        severity=AlertSeverity.CRITICAL,
-                        message=alert_info,
-                        source='health_monitor',
-                        metadata={'health_check': True}
-                    )
+        health_data = health_cache.get_or_set('detailed', _run_detailed_health_check)
         
         return jsonify(health_data), 200 if health_data['overall_status'] != 'critical' else 503
         
@@ -455,451 +812,456 @@ def detailed_health_check():
         logger.error(f"Detailed health check failed: {e}")
         return jsonify({
             'overall_status': 'critical',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'error': str(e),
             'service': 'mlb-data-service-enhanced'
         }), 503
 
+# Alert lists are cached and cleared whenever alerts change through this service;
+# the TTLs bound staleness for alerts raised by the background health monitor
+active_alerts_cache = TTLCache(ttl=int(os.getenv('ALERT_CACHE_TTL', 10)), maxsize=1)
+alert_history_cache = TTLCache(ttl=int(os.getenv('ALERT_HISTORY_CACHE_TTL', 30)), maxsize=32)
+
+def _load_active_alerts():
+    """Return the alert manager's active alerts, empty when they cannot be read"""
+    try:
+        return _get_active_alerts()
+    except Exception as e:
+        logger.warning(f"Failed to load active alerts: {e}")
+        return []
+
+def cached_active_alerts():
+    """Return the active alert summary, refreshed at most every ALERT_CACHE_TTL seconds"""
+    return active_alerts_cache.get_or_set('active', _load_active_alerts)
+
+def cached_alert_history(hours, limit):
+    """Return get_alert_history() for (hours, limit), refreshed at most every ALERT_HISTORY_CACHE_TTL seconds"""
+    if _get_alert_history is None:
+        return []
+    return alert_history_cache.get_or_set(
+        (hours, limit), lambda: _get_alert_history(hours=hours, limit=limit)
+    )
+
+def invalidate_alert_caches():
+    """Drop cached alert lists after an alert is created, acknowledged or resolved"""
+    active_alerts_cache.clear()
+    alert_history_cache.clear()
+    monitoring_status_cache.clear()
+
 @app.route('/api/v1/monitoring/alerts', methods=['GET'])
+@safe_endpoint('Failed to manage alerts')
 def get_alerts():
     """Get current alert status and management"""
-    try:
-        # Get query parameters
-        action = request.args.get('action')
-        alert_id = request.args.get('alert_id')
-        acknowledged_by = request.args.get('acknowledged_by', 'api_user')
-        
-        # Handle alert actions
-        if action == 'acknowledge' and alert_id:
-            success = alert_manager.acknowledge_alert(alert_id, acknowledged_by)
-            if success:
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Alert {alert_id} acknowledged',
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Failed to acknowledge alert {alert_id}',
-                    'timestamp': datetime.now().isoformat()
-                }), 404
-        
-        elif action == 'resolve' and alert_id:
-            resolution_message = request.args.get('resolution_message', 'Manually resolved via API')
-            success = alert_manager.resolve_alert(alert_id, resolution_message)
-            if success:
-                return jsonify({
-                    'status': 'success',
-                    'message': f'Alert {alert_id} resolved',
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Failed to resolve alert {alert_id}',
-                    'timestamp': datetime.now().isoformat()
-                }), 404
-        
-        # Default: return alert summary
-        # Use correct method name with fallback
-        try:
-            alert_summary = alert_manager.get_active_alerts() if hasattr(alert_manager, 'get_active_alerts') else []
-        except:
-            alert_summary = []
-        
-        return jsonify({
-            'status': 'success',
-            'timestamp': datetime.now().isoformat(),
-            'alert_summary': alert_summary
-        })
-        
-    except Exception as e:
-        logger.error(f"Alert management failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to manage alerts',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    # Get query parameters
+    action = request.args.get('action')
+    alert_id = request.args.get('alert_id')
+    acknowledged_by = request.args.get('acknowledged_by', 'api_user')
+    
+    # Handle alert actions
+    if action == 'acknowledge' and alert_id:
+        success = alert_manager.acknowledge_alert(alert_id, acknowledged_by)
+        if success:
+            invalidate_alert_caches()
+            return jsonify({
+                'status': 'success',
+                'message': f'Alert {alert_id} acknowledged',
+                'timestamp': now_iso()
+            })
+        else:
+            return jsonify({
+                'status': 'error',
+                'message': f'Failed to acknowledge alert {alert_id}',
+                'timestamp': now_iso()
+            }), 404
+    
+    elif action == 'resolve' and alert_id:
+        resolution_message = request.args.get('resolution_message', 'Manually resolved via API')
+        success = alert_manager.resolve_alert(alert_id, resolution_message)
+        if success:
+            invalidate_alert_caches()
+            return jsonify({
+                'status': 'success',
+                'message': f'Alert {alert_id} resolved',
+                'timestamp': now_iso()
+            })
+        else:
+            return jsonify({
+                'status': 'error',
+                'message': f'Failed to resolve alert {alert_id}',
+                'timestamp': now_iso()
+            }), 404
+    
+    # Default: return alert summary
+    alert_summary = cached_active_alerts()
+    
+    return jsonify({
+        'status': 'success',
+        'timestamp': now_iso(),
+        'alert_summary': alert_summary
+    })
 
 @app.route('/api/v1/monitoring/alerts/history', methods=['GET'])
+@safe_endpoint('Failed to retrieve alert history')
 def get_alert_history():
     """Get alert history for specified time period"""
+    hours = request.args.get('hours', 24, type=int)
+    limit = request.args.get('limit', 100, type=int)
+    
+    # Validate parameters
+    if hours < 1 or hours > 168:  # Max 1 week
+        hours = 24
+    if limit < 1 or limit > 1000:
+        limit = 100
+    
+    history = cached_alert_history(hours, limit)
+    
+    return jsonify({
+        'status': 'success',
+        'timestamp': now_iso(),
+        'time_period_hours': hours,
+        'limit': limit,
+        'count': len(history),
+        'alerts': history
+    })
+
+# Monitoring status is assembled and serialized once per MONITORING_STATUS_TTL for all dashboard
+# polls, and rebuilt early when alerts or stored data change
+MONITORING_STATUS_TTL = float(os.getenv('MONITORING_STATUS_TTL', 15))
+monitoring_status_cache = TTLCache(ttl=MONITORING_STATUS_TTL, maxsize=1)
+service_start_time = time.time()
+
+SYSTEM_METRICS_TTL = float(os.getenv('SYSTEM_METRICS_TTL', 1))
+system_metrics_cache = TTLCache(ttl=SYSTEM_METRICS_TTL, maxsize=1)
+
+@lru_cache(maxsize=None)
+def _psutil():
+    """Import psutil on first use, keeping it off the worker start-up path"""
+    import psutil
+    # cpu_percent(interval=None) reports usage since its previous call; prime it so
+    # requests never block sampling the CPU, and read /proc at most once a second
+    psutil.cpu_percent(interval=None)
+    return psutil
+
+def _read_system_usage():
+    """Return memory, CPU and root disk usage percentages, zeros when unavailable"""
     try:
-        hours = request.args.get('hours', 24, type=int)
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Validate parameters
-        if hours < 1 or hours > 168:  # Max 1 week
-            hours = 24
-        if limit < 1 or limit > 1000:
-            limit = 100
-        
-        history = alert_manager.get_alert_history(hours=hours, limit=limit)
-        
-        return jsonify({
-            'status': 'success',
-            'timestamp': datetime.now().isoformat(),
-            'time_period_hours': hours,
-            'limit': limit,
-            'count': len(history),
-            'alerts': history
-        })
-        
+        psutil = _psutil()
+        return (psutil.virtual_memory().percent, psutil.cpu_percent(interval=None),
+                psutil.disk_usage('/').percent)
     except Exception as e:
-        logger.error(f"Failed to get alert history: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve alert history',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        logger.warning(f"System metrics unavailable: {e}")
+        return 0, 0, 0
 
-@app.route('/api/v1/monitoring/status', methods=['GET'])
-def monitoring_dashboard_status():
-    """Dashboard data endpoint for monitoring interface"""
+def get_system_metrics():
+    """Return the (memory, cpu, disk) usage tuple, refreshed every SYSTEM_METRICS_TTL seconds"""
+    return system_metrics_cache.get_or_set('usage', _read_system_usage)
+
+def _build_monitoring_status():
+    """Build the monitoring dashboard payload"""
+    # Get comprehensive health data
+    health_data = _get_health()
+    
+    # Get alert summary
+    alert_summary = cached_active_alerts()
+    if not isinstance(alert_summary, dict):
+        alert_summary = {}
+    
+    # Get recent alert history (last 6 hours)
     try:
-        # Get comprehensive health data
-        # Use correct method name with fallback
-        try:
-            health_data = health_monitor.get_cached_health() or health_monitor.run_health_check()
-        except AttributeError:
-            health_data = {"status": "healthy", "fallback": True}
-        
-        # Get alert summary
-        # Use correct method name with fallback
-        try:
-            alert_summary = alert_manager.get_active_alerts() if hasattr(alert_manager, 'get_active_alerts') else []
-        except:
-            alert_summary = []
-        
-        # Get recent alert history (last 6 hours)
-        try:
-            recent_alerts = alert_manager.get_alert_history(hours=6, limit=50) if hasattr(alert_manager, 'get_alert_history') else []
-        except:
-            recent_alerts = []
-        
-        # Calculate uptime percentage (simplified)
-        uptime_hours = health_data.get('uptime_hours', 0) if isinstance(health_data, dict) else 0
-        uptime_percentage = min(99.9, (uptime_hours / (uptime_hours + 0.1)) * 100)
-        
-        # System performance summary
-        system_metrics = health_data.get('metrics', {}).get('system', {}) if isinstance(health_data, dict) else {}
-        performance_score = 100
-        if system_metrics.get('cpu_percent', 0) > 80:
-            performance_score -= 20
-        if system_metrics.get('memory_percent', 0) > 85:
+        recent_alerts = cached_alert_history(6, 50)
+    except:
+        recent_alerts = []
+    
+    # Calculate uptime percentage (simplified)
+    uptime_hours = health_data.get('uptime_hours', 0) if isinstance(health_data, dict) else 0
+    uptime_percentage = min(99.9, (uptime_hours / (uptime_hours + 0.1)) * 100)
+    
+    # System performance summary
+    system_metrics = health_data.get('metrics', {}).get('system', {}) if isinstance(health_data, dict) else {}
+    performance_score = 100
+    if system_metrics.get('cpu_percent', 0) > 80:
+        performance_score -= 20
+    if system_metrics.get('memory_percent', 0) > 85:
+        performance_score -= 20
+    if isinstance(health_data, dict):
+        if health_data.get('overall_status') == 'critical':
+            performance_score -= 40
+        elif health_data.get('overall_status') == 'warning':
             performance_score -= 20
-        if isinstance(health_data, dict):
-            if health_data.get('overall_status') == 'critical':
-                performance_score -= 40
-            elif health_data.get('overall_status') == 'warning':
-                performance_score -= 20
-        
-        # Data freshness metrics
-        db_metrics = health_data.get('metrics', {}).get('database', {}) if isinstance(health_data, dict) else {}
-        api_metrics = health_data.get('metrics', {}).get('external_apis', {}) if isinstance(health_data, dict) else {}
-        
-        dashboard_data = {
-            'overall_status': health_data.get('overall_status', 'unknown') if isinstance(health_data, dict) else 'unknown',
-            'timestamp': datetime.now().isoformat(),
-            'service_info': {
-                'name': 'MLB Data Service Enhanced',
-                'version': '2.0.0',
-                'uptime_hours': uptime_hours,
-                'uptime_percentage': round(uptime_percentage, 2),
-                'performance_score': max(0, performance_score)
+    
+    # Data freshness metrics
+    db_metrics = health_data.get('metrics', {}).get('database', {}) if isinstance(health_data, dict) else {}
+    api_metrics = health_data.get('metrics', {}).get('external_apis', {}) if isinstance(health_data, dict) else {}
+    
+    dashboard_data = {
+        'overall_status': health_data.get('overall_status', 'unknown') if isinstance(health_data, dict) else 'unknown',
+        'timestamp': now_iso(),
+        'service_info': {
+            **_SERVICE_INFO_BASE,
+            'uptime_hours': uptime_hours,
+            'uptime_percentage': round(uptime_percentage, 2),
+            'performance_score': max(0, performance_score)
+        },
+        'system_health': {
+            'cpu_usage': system_metrics.get('cpu_percent', 0),
+            'memory_usage': system_metrics.get('memory_percent', 0),
+            'disk_usage': system_metrics.get('disk_percent', 0),
+            'network_connections': system_metrics.get('network_connections', 0)
+        },
+        'database_health': {
+            'connection_pool': f"{db_metrics.get('active_connections', 0)}/{db_metrics.get('max_connections', 0)}",
+            'response_time': f"{db_metrics.get('query_response_time', 0):.3f}s",
+            'size_mb': db_metrics.get('database_size_mb', 0),
+            'last_query': db_metrics.get('last_successful_query', now_iso())
+        },
+        'external_apis': {
+            'pybaseball': {
+                'status': api_metrics.get('pybaseball_status', 'unknown'),
+                'response_time': f"{api_metrics.get('pybaseball_response_time', 0):.3f}s"
             },
-            'system_health': {
-                'cpu_usage': system_metrics.get('cpu_percent', 0),
-                'memory_usage': system_metrics.get('memory_percent', 0),
-                'disk_usage': system_metrics.get('disk_percent', 0),
-                'network_connections': system_metrics.get('network_connections', 0)
+            'mlb_api': {
+                'status': api_metrics.get('mlb_api_status', 'unknown'),
+                'response_time': f"{api_metrics.get('mlb_api_response_time', 0):.3f}s"
             },
-            'database_health': {
-                'connection_pool': f"{db_metrics.get('active_connections', 0)}/{db_metrics.get('max_connections', 0)}",
-                'response_time': f"{db_metrics.get('query_response_time', 0):.3f}s",
-                'size_mb': db_metrics.get('database_size_mb', 0),
-                'last_query': db_metrics.get('last_successful_query', datetime.now().isoformat())
+            'fangraphs': {
+                'status': api_metrics.get('fangraphs_status', 'unknown'),
+                'response_time': f"{api_metrics.get('fangraphs_response_time', 0):.3f}s"
+            }
+        },
+        'alerts': {
+            'total_active': alert_summary.get('total_active', 0),
+            'critical_count': alert_summary.get('severity_breakdown', {}).get('critical', 0),
+            'warning_count': alert_summary.get('severity_breakdown', {}).get('warning', 0),
+            'acknowledged_count': alert_summary.get('acknowledged', 0),
+            'recent_alerts': recent_alerts[:10]  # Last 10 alerts
+        },
+        'recommendations': health_data.get('recommendations', []),
+        'monitoring_config': {
+            'auto_recovery_enabled': alert_summary.get('auto_recovery_enabled', False),
+            'notification_channels': alert_summary.get('notification_channels', 0),
+            **_MONITORING_CONFIG_BASE
+        }
+    }
+    
+    # Simplified status consumed by the monitoring page
+    db_stats = cached_database_stats()
+    db_connected = db_manager.test_connection_health()
+    memory_percent, cpu_percent, disk_percent = get_system_metrics()
+    
+    # Calculate simple health score
+    health_score = 100
+    system_status = 'healthy'
+    alerts = []
+    
+    if not db_connected:
+        system_status = 'error'
+        health_score -= 50
+        alerts.append({
+            'type': 'error',
+            'title': 'Database Connection Failed',
+            'message': 'Unable to connect to the PostgreSQL database',
+            'timestamp': now_iso()
+        })
+    
+    if memory_percent > 85:
+        system_status = 'warning' if system_status == 'healthy' else system_status
+        health_score -= 20
+    
+    if cpu_percent > 80:
+        system_status = 'warning' if system_status == 'healthy' else system_status
+        health_score -= 15
+    
+    # Simple data source status
+    fangraphs_batting_count = db_stats.get('fangraphs_batting_count', 0)
+    fangraphs_pitching_count = db_stats.get('fangraphs_pitching_count', 0)
+    statcast_count = db_stats.get('statcast_count', 0)
+    
+    return {
+        'company': 'StatEdge',
+        'service': 'MLB Analytics Platform',
+        'status': 'success',
+        'timestamp': now_iso(),
+        'system_status': system_status,
+        'overall_health_score': health_score,
+        'database_connected': db_connected,
+        'database_stats': {
+            'fangraphs_batting_count': fangraphs_batting_count,
+            'fangraphs_pitching_count': fangraphs_pitching_count,
+            'statcast_count': statcast_count,
+            'total_records': fangraphs_batting_count + fangraphs_pitching_count + statcast_count
+        },
+        'system_health': {
+            'status': system_status,
+            'service_status': 'operational',
+            'database_status': 'connected' if db_connected else 'disconnected',
+            'uptime': int(time.time() - service_start_time)
+        },
+        'system_metrics': {
+            'cpu': {'percent': cpu_percent},
+            'memory': {'percent': memory_percent},
+            'disk': {'percent': disk_percent}
+        },
+        'data_sources': {
+            'fangraphs_batting': {
+                'status': 'healthy' if fangraphs_batting_count > 0 else 'warning',
+                'records': fangraphs_batting_count,
+                'total_records': fangraphs_batting_count,
+                'last_update': 'Recent'
             },
-            'external_apis': {
-                'pybaseball': {
-                    'status': api_metrics.get('pybaseball_status', 'unknown'),
-                    'response_time': f"{api_metrics.get('pybaseball_response_time', 0):.3f}s"
-                },
-                'mlb_api': {
-                    'status': api_metrics.get('mlb_api_status', 'unknown'),
-                    'response_time': f"{api_metrics.get('mlb_api_response_time', 0):.3f}s"
-                },
-                'fangraphs': {
-                    'status': api_metrics.get('fangraphs_status', 'unknown'),
-                    'response_time': f"{api_metrics.get('fangraphs_response_time', 0):.3f}s"
-                }
+            'fangraphs_pitching': {
+                'status': 'healthy' if fangraphs_pitching_count > 0 else 'warning',
+                'records': fangraphs_pitching_count,
+                'total_records': fangraphs_pitching_count,
+                'last_update': 'Recent'
             },
-            'alerts': {
-                'total_active': alert_summary.get('total_active', 0),
-                'critical_count': alert_summary.get('severity_breakdown', {}).get('critical', 0),
-                'warning_count': alert_summary.get('severity_breakdown', {}).get('warning', 0),
-                'acknowledged_count': alert_summary.get('acknowledged', 0),
-                'recent_alerts': recent_alerts[:10]  # Last 10 alerts
+            'statcast': {
+                'status': 'healthy' if statcast_count > 0 else 'warning',
+                'records': statcast_count,
+                'total_records': statcast_count,
+                'last_update': db_stats.get('latest_statcast_date') or 'Recent'
             },
-            'recommendations': health_data.get('recommendations', []),
-            'monitoring_config': {
-                'auto_recovery_enabled': alert_summary.get('auto_recovery_enabled', False),
-                'notification_channels': alert_summary.get('notification_channels', 0),
-                'health_check_interval': '60 seconds'
+            'api_performance': {
+                'status': 'healthy',
+                'response_time_ms': 150,
+                'success_rate': 99.5
             }
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'dashboard': dashboard_data
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to get monitoring dashboard status: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve monitoring dashboard data',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        },
+        'performance': {
+            'daily_collections': 3,  # Would be real metric in production
+            'weekly_growth': '+12%',  # Would be calculated in production
+            'data_freshness': 30,  # minutes since last update
+            'memory_usage': round(memory_percent, 1),
+            'cpu_usage': round(cpu_percent, 1),
+            'disk_usage': round(disk_percent, 1)
+        },
+        'alerts': alerts,
+        'recent_alerts': [],
+        'uptime_percentage': 99.9,
+        'dashboard': dashboard_data
+    }
+
+def _render_monitoring_status():
+    """Serialize the monitoring payload once and tag it for conditional requests"""
+    body = app.json.dumps_bytes(_build_monitoring_status())
+    return hashlib.blake2b(body, digest_size=16).hexdigest(), body
+
+@app.route('/api/v1/monitoring/status', methods=['GET'])
+@safe_endpoint('Failed to retrieve monitoring dashboard data')
+def monitoring_dashboard_status():
+    """Dashboard data endpoint for monitoring interface"""
+    # Polls between rebuilds reuse the cached bytes without walking the dict again
+    etag, body = monitoring_status_cache.get_or_set('status', _render_monitoring_status)
+    if etag_requested(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/v1/monitoring/test-alert', methods=['POST'])
+@safe_endpoint('Failed to create test alert')
 def create_test_alert():
     """Create a test alert for testing the monitoring system"""
-    try:
-        data = request.get_json() or {}
-        
-        # Create test alert
-        alert_id = alert_manager.create_alert(
-            name=data.get('name', 'Test Alert'),
-            severity=AlertSeverity(data.get('severity', 'warning')),
-            message=data.get('message', 'This is a test alert created via API'),
-            source='api_test',
-            metric_value=data.get('metric_value', 'test_value'),
-            threshold=data.get('threshold', {'warning': 50, 'critical': 80}),
-            metadata={'test': True, 'created_by': 'api'}
-        )
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Test alert created successfully',
-            'alert_id': alert_id,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to create test alert: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to create test alert',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    data = request_payload()
+    
+    # Create test alert
+    alert_id = alert_manager.create_alert(
+        name=data.get('name', 'Test Alert'),
+        severity=AlertSeverity(data.get('severity', 'warning')),
+        message=data.get('message', 'This is a test alert created via API'),
+        source='api_test',
+        metric_value=data.get('metric_value', 'test_value'),
+        threshold=data.get('threshold', {'warning': 50, 'critical': 80}),
+        metadata={'test': True, 'created_by': 'api'}
+    )
+    invalidate_alert_caches()
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Test alert created successfully',
+        'alert_id': alert_id,
+        'timestamp': now_iso()
+    })
 
 @app.route('/api/v1/player/ids', methods=['GET'])
+@safe_endpoint('Failed to retrieve player ID mappings')
+@data_etag()
 def get_player_id_mappings():
     """Get ID mappings for a specific player"""
-    try:
-        player_name = request.args.get('name')
-        fangraphs_id = request.args.get('fangraphs_id', type=int)
-        mlb_id = request.args.get('mlb_id', type=int)
-        
-        if not any([player_name, fangraphs_id, mlb_id]):
-            return jsonify({
-                'status': 'error',
-                'message': 'Must provide name, fangraphs_id, or mlb_id parameter',
-                'timestamp': datetime.now().isoformat()
-            }), 400
-        
-        profile = db_manager.get_unified_player_profile(
-            player_name=player_name,
-            fangraphs_id=fangraphs_id,
-            mlb_id=mlb_id
-        )
-        
-        if profile:
-            id_mappings = {
-                'full_name': profile.get('full_name'),
-                'identifiers': {
-                    'fangraphs_id': profile.get('key_fangraphs'),
-                    'mlb_id': profile.get('key_mlbam'),
-                    'bbref_id': profile.get('key_bbref'),
-                    'retro_id': profile.get('key_retro')
-                },
-                'career_span': {
-                    'first_year': profile.get('mlb_played_first'),
-                    'last_year': profile.get('mlb_played_last')
-                }
-            }
-            
-            return jsonify({
-                'status': 'success',
-                'player_ids': id_mappings,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'status': 'not_found',
-                'message': 'Player not found',
-                'timestamp': datetime.now().isoformat()
-            }), 404
-            
-    except Exception as e:
-        logger.error(f"Failed to get player ID mappings: {e}")
+    player_name = request.args.get('name')
+    fangraphs_id = request.args.get('fangraphs_id', type=int)
+    mlb_id = request.args.get('mlb_id', type=int)
+    
+    if not any([player_name, fangraphs_id, mlb_id]):
         return jsonify({
             'status': 'error',
-            'message': 'Failed to retrieve player ID mappings',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'message': 'Must provide name, fangraphs_id, or mlb_id parameter',
+            'timestamp': now_iso()
+        }), 400
+    
+    profile = cached_player_profile(player_name, fangraphs_id, mlb_id, _PLAYER_ID_FIELDS)
+    
+    if profile:
+        id_mappings = {
+            'full_name': profile.get('full_name'),
+            'identifiers': {
+                'fangraphs_id': profile.get('key_fangraphs'),
+                'mlb_id': profile.get('key_mlbam'),
+                'bbref_id': profile.get('key_bbref'),
+                'retro_id': profile.get('key_retro')
+            },
+            'career_span': {
+                'first_year': profile.get('mlb_played_first'),
+                'last_year': profile.get('mlb_played_last')
+            }
+        }
+        
+        return cacheable(jsonify({
+            'status': 'success',
+            'player_ids': id_mappings,
+            'timestamp': now_iso()
+        }))
+    else:
+        return jsonify({
+            'status': 'not_found',
+            'message': 'Player not found',
+            'timestamp': now_iso()
+        }), 404
 
-# Global variables for monitoring
-service_start_time = time.time()
+# The dashboard page has no template context, so it is rendered once per process
+_dashboard_page = None
 
 @app.route('/monitoring')
 def monitoring_dashboard():
     """Serve the monitoring dashboard HTML page"""
-    return render_template('monitoring/dashboard.html')
+    global _dashboard_page
+    if _dashboard_page is None:
+        html = render_template('monitoring/dashboard.html').encode()
+        _dashboard_page = (html, hashlib.md5(html).hexdigest())
+    
+    body, etag = _dashboard_page
+    response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
 
-@app.route('/api/v1/monitoring/status', methods=['GET'])
-def monitoring_status():
-    """Simplified monitoring status endpoint for dashboard"""
-    try:
-        # Get basic database stats
-        db_stats = db_manager.get_database_stats()
-        db_connected = db_manager.test_connection()
-        
-        # Get system resource usage (with fallbacks)
-        try:
-            memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            disk = psutil.disk_usage('/')
-        except:
-            memory = type('obj', (object,), {'percent': 0})()
-            cpu_percent = 0
-            disk = type('obj', (object,), {'total': 1, 'used': 0})()
-        
-        # Calculate simple health score
-        health_score = 100
-        system_status = 'healthy'
-        alerts = []
-        
-        if not db_connected:
-            system_status = 'error'
-            health_score -= 50
-            alerts.append({
-                'type': 'error',
-                'title': 'Database Connection Failed',
-                'message': 'Unable to connect to the PostgreSQL database',
-                'timestamp': datetime.now().isoformat()
-            })
-        
-        if memory.percent > 85:
-            system_status = 'warning' if system_status == 'healthy' else system_status
-            health_score -= 20
-        
-        if cpu_percent > 80:
-            system_status = 'warning' if system_status == 'healthy' else system_status
-            health_score -= 15
-        
-        # Simple data source status
-        fangraphs_batting_count = db_stats.get('fangraphs_batting_count', 0)
-        fangraphs_pitching_count = db_stats.get('fangraphs_pitching_count', 0)
-        statcast_count = db_stats.get('statcast_count', 0)
-        
-        return jsonify({
-            'company': 'StatEdge',
-            'service': 'MLB Analytics Platform',
-            'status': 'success',
-            'timestamp': datetime.now().isoformat(),
-            'system_status': system_status,
-            'overall_health_score': health_score,
-            'database_connected': db_connected,
-            'database_stats': {
-                'fangraphs_batting_count': fangraphs_batting_count,
-                'fangraphs_pitching_count': fangraphs_pitching_count,
-                'statcast_count': statcast_count,
-                'total_records': fangraphs_batting_count + fangraphs_pitching_count + statcast_count
-            },
-            'system_metrics': {
-                'cpu': {'percent': cpu_percent},
-                'memory': {'percent': memory.percent},
-                'disk': {'percent': (disk.used / disk.total) * 100 if disk.total > 0 else 0}
-            },
-            'data_sources': {
-                'fangraphs_batting': {
-                    'status': 'healthy' if fangraphs_batting_count > 0 else 'warning',
-                    'records': fangraphs_batting_count,
-                    'last_update': 'Recent'
-                },
-                'fangraphs_pitching': {
-                    'status': 'healthy' if fangraphs_pitching_count > 0 else 'warning', 
-                    'records': fangraphs_pitching_count,
-                    'last_update': 'Recent'
-                },
-                'statcast': {
-                    'status': 'healthy' if statcast_count > 0 else 'warning',
-                    'records': statcast_count,
-                    'last_update': 'Recent'
-                },
-                'api_performance': {
-                    'status': 'healthy',
-                    'response_time_ms': 150,
-                    'success_rate': 99.5
-                }
-            },
-            'alerts': alerts,
-            'recent_alerts': [],
-            'uptime_percentage': 99.9
-        })
-        
-    except Exception as e:
-        logger.error(f"Monitoring status error: {e}")
-        return jsonify({
-            'company': 'StatEdge',
-            'status': 'error',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
-                    'total_endpoints': 15
-                }
-            },
-            'performance': {
-                'daily_collections': 3,  # Would be real metric in production
-                'weekly_growth': '+12%',  # Would be calculated in production
-                'data_freshness': 30,  # minutes since last update
-                'memory_usage': round(memory.percent, 1),
-                'cpu_usage': round(cpu_percent, 1),
-                'disk_usage': round(disk.percent, 1)
-            },
-            'alerts': alerts
-        }
-        
-        return jsonify(monitoring_data)
-        
-    except Exception as e:
-        logger.error(f"Monitoring status failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to retrieve monitoring status',
-            'error': str(e),
-            'timestamp': datetime.now().isoformat(),
-            'system_health': {
-                'status': 'error',
-                'service_status': 'error',
-                'database_status': 'unknown',
-                'uptime': int(time.time() - service_start_time)
-            },
-            'alerts': [{
-                'type': 'error',
-                'title': 'Monitoring System Error',
-                'message': f'Failed to collect monitoring data: {str(e)}',
-                'timestamp': datetime.now().isoformat()
-            }]
-        }), 500
+@app.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Report unhandled view errors with the standard 500 payload"""
+    # Let 404/405 and other HTTP errors keep their own responses
+    if isinstance(error, HTTPException):
+        return error
+    
+    view = app.view_functions.get(request.endpoint)
+    message = getattr(view, 'error_message', 'Internal server error')
+    logger.error(f"{message}: {error}")
+    return jsonify({
+        'status': 'error',
+        'message': message,
+        'error': str(error),
+        'timestamp': now_iso()
+    }), 500
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -908,7 +1270,7 @@ def internal_error(error):
     return jsonify({
         'status': 'error',
         'message': 'Internal server error',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     }), 500
 
 @app.teardown_appcontext
@@ -8,13 +8,16 @@ Integrates with PyBaseball, MLB Stats API, and other data sources.
 """
 
 import pybaseball as pyb
-import statsapi
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional, Any
 import time
+import atexit
+import threading
 import asyncio
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor
@@ -22,6 +25,8 @@ from .enhanced_database import EnhancedDatabaseManager
 
 logger = logging.getLogger(__name__)
 
+MLB_STATS_API_URL = 'https://statsapi.mlb.com/api/v1'
+
 # Import monitoring for data quality checks
 try:
     from .monitoring.data_monitor import DataQualityValidator
@@ -50,6 +55,12 @@ class ExternalAPIManager:
         # Thread pool for concurrent operations
         self.executor = ThreadPoolExecutor(max_workers=4)
         
+        # Keep-alive HTTP sessions for outbound API calls, one per thread
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        atexit.register(self._close_sessions)
+        
         # Disable PyBaseball cache for fresh data
         pyb.cache.disable()
         
@@ -77,6 +88,66 @@ class ExternalAPIManager:
         
         logger.info("Enhanced External API Manager initialized with real-time capabilities and monitoring")
     
+    def _create_session(self) -> requests.Session:
+        """Build a pooled HTTP session with retries for transient failures"""
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'GET'})
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _session(self) -> requests.Session:
+        """Return the calling thread's HTTP session, creating it on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def _close_sessions(self):
+        """Close every thread's HTTP session"""
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+    
+    def _get_schedule(self, date_str: str) -> List[Dict[str, Any]]:
+        """Fetch one day's MLB schedule from the Stats API
+        
+        Games use the statsapi.schedule() keys read by the collectors.
+        """
+        response = self._session().get(
+            f"{MLB_STATS_API_URL}/schedule",
+            params={'sportId': 1, 'date': date_str, 'hydrate': 'linescore'},
+            timeout=30
+        )
+        response.raise_for_status()
+        
+        games = []
+        for day in response.json().get('dates', []):
+            for game in day.get('games', []):
+                away, home = game['teams']['away'], game['teams']['home']
+                games.append({
+                    'game_id': game['gamePk'],
+                    'game_datetime': game['gameDate'],
+                    'status': game['status']['detailedState'],
+                    'away_name': away['team'].get('name', '???'),
+                    'home_name': home['team'].get('name', '???'),
+                    'away_score': away.get('score', '0'),
+                    'home_score': home.get('score', '0'),
+                    'current_inning': game.get('linescore', {}).get('currentInning', ''),
+                    'venue_name': game.get('venue', {}).get('name')
+                })
+        return games
+    
     def _rate_limit(self, api_name: str):
         """Enforce rate limiting for API calls"""
         if api_name in self.last_request_times:
@@ -231,7 +302,7 @@ class ExternalAPIManager:
             
             try:
                 # Get today's schedule from MLB API
-                schedule = statsapi.schedule(start_date=today, end_date=today)
+                schedule = self._get_schedule(today)
                 
                 games = []
                 for game in schedule:
@@ -562,7 +633,7 @@ class ExternalAPIManager:
                 
                 try:
                     # Get schedule from MLB API
-                    schedule = statsapi.schedule(start_date=date_str, end_date=date_str)
+                    schedule = self._get_schedule(date_str)
                     
                     for game in schedule:
                         # Store game data (you could extend this to store in database)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Collection Job Store
+=======================================
+
+Background collection jobs recorded in the collection_jobs table, so a job
+submitted to one gunicorn worker can be polled through any other.
+"""
+
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from psycopg2.extras import Json, RealDictCursor
+
+logger = logging.getLogger(__name__)
+
+_JOB_COLUMNS = ('job_id, collection_type, parameters, status, submitted_at, '
+                'finished_at, result, error_message')
+
+
+def _dumps(value: Any) -> str:
+    """Encode job parameters and results, with dates as ISO strings"""
+    return json.dumps(value, default=lambda o: o.isoformat() if isinstance(o, (date, datetime)) else str(o))
+
+
+class CollectionJobStore:
+    """Create, finish and look up collection jobs shared by all workers"""
+
+    def __init__(self, get_connection: Callable, return_connection: Callable,
+                 retention_seconds: int = 3600):
+        self.get_connection = get_connection
+        self.return_connection = return_connection
+        self.retention_seconds = retention_seconds
+
+    @contextmanager
+    def _cursor(self):
+        """Check out a pooled connection; commit on success, roll back on error"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
+    def create(self, collection_type: str, parameters: Dict[str, Any] = None,
+               dedupe_seconds: int = 0) -> Tuple[str, bool]:
+        """Record a queued job and return (job_id, created)
+
+        With dedupe_seconds, an unfinished job of the same type and parameters
+        submitted within that window is returned instead (created is False).
+        """
+        parameters = Json(parameters or {}, dumps=_dumps)
+        with self._cursor() as cursor:
+            # Serializes concurrent submissions of one collection type across workers
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"collection_jobs:{collection_type}",))
+
+            cursor.execute(
+                "DELETE FROM collection_jobs WHERE submitted_at < NOW() - make_interval(secs => %s)",
+                (self.retention_seconds,)
+            )
+
+            if dedupe_seconds:
+                cursor.execute("""
+                    SELECT job_id FROM collection_jobs
+                    WHERE collection_type = %s AND parameters = %s
+                      AND status IN ('queued', 'running')
+                      AND submitted_at >= NOW() - make_interval(secs => %s)
+                    ORDER BY submitted_at DESC
+                    LIMIT 1
+                """, (collection_type, parameters, dedupe_seconds))
+                pending = cursor.fetchone()
+                if pending:
+                    return pending['job_id'], False
+
+            job_id = uuid.uuid4().hex
+            cursor.execute("""
+                INSERT INTO collection_jobs (job_id, collection_type, parameters, status, submitted_at)
+                VALUES (%s, %s, %s, 'queued', NOW())
+            """, (job_id, collection_type, parameters))
+
+        return job_id, True
+
+    def _set_status(self, job_id: str, status: str, result: Any = None, error_message: str = None):
+        """Update a job's status, stamping finished_at for terminal states"""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    UPDATE collection_jobs
+                    SET status = %s,
+                        result = %s,
+                        error_message = %s,
+                        finished_at = CASE WHEN %s IN ('completed', 'failed') THEN NOW() END
+                    WHERE job_id = %s
+                """, (status, Json(result, dumps=_dumps) if result is not None else None,
+                      error_message, status, job_id))
+        except Exception as e:
+            logger.error(f"Failed to record collection job {job_id} as {status}: {e}")
+
+    def run(self, job_id: str, func: Callable, *args, **kwargs) -> Any:
+        """Run func as job_id on the calling thread, recording its progress and outcome"""
+        self._set_status(job_id, 'running')
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Collection job {job_id} failed: {e}")
+            self._set_status(job_id, 'failed', error_message=str(e))
+            raise
+        self._set_status(job_id, 'completed', result=result)
+        return result
+
+    def last_completed(self) -> Dict[str, str]:
+        """Return when each collection type last finished a job successfully"""
+        with self._cursor() as cursor:
+            cursor.execute("""
+                SELECT collection_type, MAX(finished_at) AS finished_at
+                FROM collection_jobs
+                WHERE status = 'completed'
+                GROUP BY collection_type
+            """)
+            return {row['collection_type']: row['finished_at'].isoformat() for row in cursor.fetchall()}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job record, or None if it does not exist or has expired"""
+        with self._cursor() as cursor:
+            cursor.execute(f"SELECT {_JOB_COLUMNS} FROM collection_jobs WHERE job_id = %s", (job_id,))
+            job = cursor.fetchone()
+
+        if job is None:
+            return None
+        job = dict(job)
+        for field in ('submitted_at', 'finished_at'):
+            if isinstance(job[field], datetime):
+                job[field] = job[field].isoformat()
+        return job
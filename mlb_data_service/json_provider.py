@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - JSON Provider
+================================
+
+orjson-backed JSON provider for the Flask applications.
+Falls back to Flask's stdlib encoder when orjson is not installed.
+"""
+
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available, using standard Flask JSON encoder")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson"""
+
+    @staticmethod
+    def default(o):
+        """Convert types orjson does not handle natively"""
+        if isinstance(o, Decimal):
+            return float(o)
+        if isinstance(o, (datetime, date, time)):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def dumps_bytes(self, obj, **kwargs) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes"""
+        if not ORJSON_AVAILABLE:
+            return super().dumps(obj, **kwargs).encode()
+
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string"""
+        if not ORJSON_AVAILABLE:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from orjson bytes without a str round trip"""
+        if not ORJSON_AVAILABLE:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self.dumps_bytes(obj, indent=2 if indent else None)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        if not ORJSON_AVAILABLE:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -34,8 +34,10 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Run as a script, the service modules are one directory up; imported as
+# monitoring.alert_manager they already resolve
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Optional database import
 try:
@@ -9,34 +9,31 @@ database connection monitoring, external API health checking, and performance tr
 
 import os
 import sys
+import importlib.util
 import time
 import logging
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 
 # Optional imports with fallbacks
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    
 try:
     import requests
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
-try:
-    import pybaseball as pyb
-    PYBASEBALL_AVAILABLE = True
-except ImportError:
-    PYBASEBALL_AVAILABLE = False
+# pybaseball pulls in pandas/matplotlib and psutil reads /proc on import;
+# load them only when the checks that need them run
+PYBASEBALL_AVAILABLE = importlib.util.find_spec('pybaseball') is not None
+PSUTIL_AVAILABLE = importlib.util.find_spec('psutil') is not None
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Run as a script, the service modules are one directory up; imported as
+# monitoring.health_monitor they already resolve
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Optional database import
 try:
@@ -53,6 +50,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _psutil():
+    """Import psutil on first use"""
+    import psutil
+    # cpu_percent(interval=None) reports usage since its previous call; prime
+    # it so later non-blocking reads report a real delta
+    psutil.cpu_percent(interval=None)
+    return psutil
+
 @dataclass
 class HealthMetric:
     """Individual health metric data structure"""
@@ -174,7 +180,8 @@ class ProductionHealthMonitor:
                 )
             
             # CPU and Memory
-            cpu_percent = psutil.cpu_percent(interval=1)
+            psutil = _psutil()
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
@@ -299,6 +306,7 @@ class ProductionHealthMonitor:
             pyb_start = time.time()
             pyb_status = "healthy"
             if PYBASEBALL_AVAILABLE:
+                import pybaseball as pyb
                 try:
                     # Quick test - get team info (lightweight call)
                     teams = pyb.team_ids()
@@ -336,6 +344,7 @@ class ProductionHealthMonitor:
             fg_start = time.time()
             fg_status = "healthy"
             if PYBASEBALL_AVAILABLE:
+                import pybaseball as pyb
                 try:
                     # Test FanGraphs data availability
                     current_year = datetime.now().year
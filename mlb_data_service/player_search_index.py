@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Player Search Index
+======================================
+
+In-memory copy of the player register used to answer name searches with a
+vectorized substring match instead of a database ILIKE scan per request.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerSearchIndex:
+    """Lower-cased, ASCII-folded player names kept in search ranking order"""
+
+    def __init__(self, loader: Callable[[], pd.DataFrame], refresh_seconds: float = 3600,
+                 retry_seconds: float = 60):
+        self.loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.retry_seconds = retry_seconds
+        self._index: Optional[Tuple[pd.DataFrame, pd.Series]] = None
+        self._attempted_at = float('-inf')
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """Reload the register; keeps the previous copy if the load comes back empty"""
+        self._attempted_at = time.monotonic()
+        rows = self.loader()
+        if rows is None or rows.empty:
+            logger.warning("Player search index load returned no rows")
+            return False
+
+        names = rows['full_name'].fillna(rows['name_last']).fillna('')
+        names = (names.str.lower().str.normalize('NFKD')
+                 .str.encode('ascii', 'ignore').str.decode('ascii'))
+        rows = rows.drop(columns=['name_last']).astype(object)
+        rows = rows.where(rows.notna(), None)
+
+        self._index = (rows.reset_index(drop=True), names.reset_index(drop=True))
+        logger.info(f"Player search index loaded ({len(rows)} players)")
+        return True
+
+    def _is_due(self) -> bool:
+        """Whether the index is missing or stale and a load may be attempted"""
+        wait = self.refresh_seconds if self._index is not None else self.retry_seconds
+        return time.monotonic() - self._attempted_at >= wait
+
+    def _refresh_and_release(self) -> None:
+        """Reload the register if still due, then release the refresh lock"""
+        try:
+            if self._is_due():
+                self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to refresh player search index: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    def search(self, query: str, limit: int = 10) -> Optional[List[Dict]]:
+        """Return up to limit players whose name contains query, or None when unavailable"""
+        # Reloads run on one background thread; requests keep answering from the
+        # current copy, or return None (database fallback) until the first load
+        if self._is_due() and self._refresh_lock.acquire(blocking=False):
+            threading.Thread(
+                target=self._refresh_and_release, name='player-index-refresh', daemon=True
+            ).start()
+
+        index = self._index
+        if index is None:
+            return None
+        rows, names = index
+        mask = names.str.contains(query, regex=False)
+        return rows.loc[mask].head(max(limit, 0)).to_dict('records')
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Request Helpers
+==================================
+
+Conditional-request and request-body helpers shared by the Flask applications.
+"""
+
+from typing import Any, Dict
+
+from flask import request
+
+# flask-compress rewrites a strong ETag to "<etag>:<encoding>" on compressed
+# responses, and compressing clients send that form back
+_ETAG_ENCODING_SUFFIXES = ('', ':gzip', ':br', ':deflate', ':zstd')
+
+
+def etag_requested(etag: str) -> bool:
+    """Whether If-None-Match names etag, in its plain or compressed form"""
+    return any(request.if_none_match.contains(etag + suffix) for suffix in _ETAG_ENCODING_SUFFIXES)
+
+
+def request_payload() -> Dict[str, Any]:
+    """Return the JSON object body of a POST, or {} when it is empty or not an object"""
+    if not request.content_length:
+        return {}
+    payload = request.get_json(silent=True, cache=False)
+    return payload if isinstance(payload, dict) else {}
@@ -8,6 +8,7 @@ Handles automated daily data collection at 7 AM using APScheduler.
 
 import logging
 import os
+import time as time_module
 from datetime import datetime, time
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -103,6 +104,22 @@ class MLBDataScheduler:
         logger.info("  - Data freshness checks: Every 30 minutes")
         logger.info("  - Weekly cleanup: Sunday 2:00 AM")
     
+    def _wait_for_collection_job(self, job_id: str, timeout: int = 300, poll_interval: float = 2.0):
+        """Poll a background collection job until it finishes or times out"""
+        deadline = time_module.monotonic() + timeout
+        
+        while time_module.monotonic() < deadline:
+            response = requests.get(f"{self.service_url}/api/v1/jobs/{job_id}", timeout=30)
+            response.raise_for_status()
+            job = response.json()
+            
+            if job.get('status') not in ('queued', 'running'):
+                return job
+            
+            time_module.sleep(poll_interval)
+        
+        raise TimeoutError(f"Collection job {job_id} did not finish within {timeout}s")
+    
     def _daily_collection_job(self):
         """Execute daily data collection sequence"""
         logger.info("Starting automated daily MLB data collection...")
@@ -114,73 +131,60 @@ class MLBDataScheduler:
             'total_records': 0
         }
         
-        # Collection sequence: Players -> Games -> Statcast
-        jobs = [
-            {
-                'name': 'players',
-                'endpoint': '/api/v1/collect/players',
-                'payload': {'limit': 100}
-            },
-            {
-                'name': 'games',
-                'endpoint': '/api/v1/collect/games',
-                'payload': {}
-            },
-            {
-                'name': 'statcast',
-                'endpoint': '/api/v1/collect/statcast',
-                'payload': {'days_back': 1, 'limit': 200}
-            }
-        ]
+        # One batched request; the service runs the collections concurrently
+        resources = ['players', 'games', 'statcast']
+        params = {
+            'players': {'limit': 100},
+            'statcast': {'days_back': 1, 'limit': 200}
+        }
         
-        for job in jobs:
-            try:
-                logger.info(f"Collecting {job['name']} data...")
-                
-                response = requests.post(
-                    f"{self.service_url}{job['endpoint']}",
-                    json=job['payload'],
-                    timeout=300  # 5 minute timeout
-                )
+        try:
+            logger.info(f"Collecting {', '.join(resources)} data...")
+            
+            response = requests.post(
+                f"{self.service_url}/api/v1/collect",
+                json={'resources': resources, 'params': params},
+                timeout=30
+            )
+            
+            if response.status_code != 202:
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+            
+            job_status = self._wait_for_collection_job(response.json()['job_id'])
+            if job_status.get('status') != 'completed':
+                raise RuntimeError(job_status.get('error', 'collection job failed'))
+            result = job_status['result']
+            
+            for name, records_collected in result.get('records_collected', {}).items():
+                collection_results['completed_jobs'].append({
+                    'job': name,
+                    'records': records_collected,
+                    'status': 'success'
+                })
+                collection_results['total_records'] += records_collected
+                logger.info(f"✅ {name} collection completed: {records_collected} records")
+            
+            for name, error_msg in result.get('errors', {}).items():
+                collection_results['failed_jobs'].append({
+                    'job': name,
+                    'error': error_msg
+                })
+                logger.error(f"❌ {name} collection failed: {error_msg}")
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    records_key = {
-                        'players': 'players_collected',
-                        'games': 'games_collected', 
-                        'statcast': 'records_collected'
-                    }.get(job['name'], 'records_collected')
-                    
-                    records_collected = result.get(records_key, 0)
-                    collection_results['completed_jobs'].append({
-                        'job': job['name'],
-                        'records': records_collected,
-                        'status': 'success'
-                    })
-                    collection_results['total_records'] += records_collected
-                    
-                    logger.info(f"✅ {job['name']} collection completed: {records_collected} records")
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
-                    collection_results['failed_jobs'].append({
-                        'job': job['name'],
-                        'error': error_msg
-                    })
-                    logger.error(f"❌ {job['name']} collection failed: {error_msg}")
-                    
-            except Exception as e:
-                error_msg = str(e)
+        except Exception as e:
+            error_msg = str(e)
+            for name in resources:
                 collection_results['failed_jobs'].append({
-                    'job': job['name'],
+                    'job': name,
                     'error': error_msg
                 })
-                logger.error(f"❌ {job['name']} collection failed: {error_msg}")
+            logger.error(f"❌ Daily collection request failed: {error_msg}")
         
         collection_results['completed_at'] = datetime.now().isoformat()
         
         # Log final results
         success_count = len(collection_results['completed_jobs'])
-        total_jobs = len(jobs)
+        total_jobs = len(resources)
         
         if success_count == total_jobs:
             logger.info(f"🎉 Daily collection completed successfully!")
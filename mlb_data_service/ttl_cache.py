@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - TTL Cache
+============================
+
+Small thread-safe in-process cache with per-entry expiry, used to serve
+repeated read requests from memory between data collections.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after ttl seconds"""
+
+    def __init__(self, ttl: float = 300, maxsize: int = 64):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._loading: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key if present and fresh"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic(), value)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss
+
+        Concurrent misses on the same key wait for a single loader call.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self.get(key, sentinel)
+                if value is sentinel:
+                    value = loader()
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                if self._loading.get(key) is key_lock:
+                    del self._loading[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
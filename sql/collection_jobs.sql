@@ -0,0 +1,22 @@
+-- Background collection jobs shared by all service workers
+--
+-- Collection endpoints answer 202 with a job id and run the collection on a
+-- background thread; any gunicorn worker can then answer the status poll from
+-- this table. Finished jobs are pruned after an hour by the services.
+--   psql "$DATABASE_URL" -f sql/collection_jobs.sql
+
+CREATE TABLE IF NOT EXISTS collection_jobs (
+    job_id VARCHAR(32) PRIMARY KEY,
+    collection_type VARCHAR(50) NOT NULL,
+    parameters JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL, -- 'queued', 'running', 'completed', 'failed'
+    submitted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP,
+    result JSONB,
+    error_message TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_collection_jobs_submitted ON collection_jobs(submitted_at);
+-- Looking up an unfinished job of the same type to join instead of re-running
+CREATE INDEX IF NOT EXISTS idx_collection_jobs_pending
+    ON collection_jobs(collection_type, submitted_at) WHERE status IN ('queued', 'running');
@@ -69,6 +69,18 @@ CREATE TABLE IF NOT EXISTS collection_status (
     data_source VARCHAR(50)
 );
 
+-- Background collection jobs, polled through /api/v1/jobs/<job_id> from any worker
+CREATE TABLE IF NOT EXISTS collection_jobs (
+    job_id VARCHAR(32) PRIMARY KEY,
+    collection_type VARCHAR(50) NOT NULL,
+    parameters JSONB NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL, -- 'queued', 'running', 'completed', 'failed'
+    submitted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP,
+    result JSONB,
+    error_message TEXT
+);
+
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_players_team ON players(team);
 CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
@@ -79,11 +91,28 @@ CREATE INDEX IF NOT EXISTS idx_games_teams ON games(home_team, away_team);
 CREATE INDEX IF NOT EXISTS idx_games_status ON games(game_status);
 
 CREATE INDEX IF NOT EXISTS idx_statcast_player ON statcast(player_name);
-CREATE INDEX IF NOT EXISTS idx_statcast_game_date ON statcast(game_date);
 CREATE INDEX IF NOT EXISTS idx_statcast_events ON statcast(events);
 
+-- Statcast reads order by (game_date DESC, at_bat_number, pitch_number) with an
+-- optional LOWER(player_name) filter; these indexes return rows already in that
+-- order so LIMIT queries stop early instead of sorting the table
+DROP INDEX IF EXISTS idx_statcast_player_lower;
+DROP INDEX IF EXISTS idx_statcast_game_date;
+CREATE INDEX IF NOT EXISTS idx_statcast_player_lower_order
+    ON statcast(LOWER(player_name), game_date DESC, at_bat_number, pitch_number);
+CREATE INDEX IF NOT EXISTS idx_statcast_game_order
+    ON statcast(game_date DESC, at_bat_number, pitch_number);
+
 CREATE INDEX IF NOT EXISTS idx_collection_status_type ON collection_status(collection_type);
 CREATE INDEX IF NOT EXISTS idx_collection_status_started ON collection_status(started_at);
+-- Partial indexes for finishing running jobs and reading the latest completions
+CREATE INDEX IF NOT EXISTS idx_collection_status_running
+    ON collection_status(collection_type) WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_collection_status_completed
+    ON collection_status(collection_type, completed_at) WHERE status = 'completed';
+CREATE INDEX IF NOT EXISTS idx_collection_jobs_submitted ON collection_jobs(submitted_at);
+CREATE INDEX IF NOT EXISTS idx_collection_jobs_pending
+    ON collection_jobs(collection_type, submitted_at) WHERE status IN ('queued', 'running');
 
 -- Create a function to update the updated_at column
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -0,0 +1,12 @@
+-- Covering index for per-batter Statcast aggregates
+--
+-- get_unified_player_profile and search_players count a batter's pitches and
+-- average launch_speed / launch_angle through a LATERAL subquery on
+-- statcast.batter; INCLUDE lets those aggregates run as index-only scans.
+--
+-- CONCURRENTLY avoids blocking Statcast loads while the index builds, so run
+-- this outside a transaction block (plain psql -f does):
+--   psql "$DATABASE_URL" -f sql/statcast_batter_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_statcast_batter_stats
+    ON statcast(batter) INCLUDE (launch_speed, launch_angle);
@@ -414,7 +414,21 @@ async function triggerCollection(source) {
             body: JSON.stringify(payload)
         });
         
-        const result = await response.json();
+        let result = await response.json();
+        
+        // Collections run in the background; poll the job until it finishes
+        if (response.status === 202) {
+            modalBody.innerHTML = '<p><i class="fas fa-spinner fa-spin"></i> Collection queued, waiting for results...</p>';
+            let job = result;
+            while (job.status === 'queued' || job.status === 'running') {
+                await new Promise(resolve => setTimeout(resolve, 3000));
+                job = await (await fetch(result.status_url)).json();
+            }
+            if (job.status !== 'completed') {
+                throw new Error(job.error || job.message || 'Collection job failed');
+            }
+            result = job.result;
+        }
         
         if (response.ok) {
             modalBody.innerHTML = `
@@ -462,6 +476,7 @@ async function testApiEndpoints() {
     
     const endpoints = [
         { name: 'Health Check', url: '/health' },
+        { name: 'Readiness Check', url: '/ready' },
         { name: 'Service Status', url: '/api/v1/status' },
         { name: 'Analytics Summary', url: '/api/v1/analytics/summary' },
         { name: 'FanGraphs Batting', url: '/api/v1/fangraphs/batting?limit=1' },
@@ -22,6 +22,21 @@ class MLBDataServiceTester:
             'Content-Type': 'application/json'
         })
     
+    def wait_for_job(self, response, timeout: int = 300):
+        """Resolve a 202 collection response into the finished job result"""
+        job_url = f"{self.base_url}{response.json()['status_url']}"
+        deadline = time.time() + timeout
+        
+        while time.time() < deadline:
+            job = self.session.get(job_url).json()
+            if job['status'] == 'completed':
+                return job['result']
+            if job['status'] == 'failed':
+                raise RuntimeError(job.get('error', 'collection job failed'))
+            time.sleep(2)
+        
+        raise TimeoutError(f"Collection job did not finish within {timeout}s")
+    
     def test_health_check(self):
         """Test service health endpoint"""
         print("🔍 Testing health check...")
@@ -78,8 +93,8 @@ class MLBDataServiceTester:
                 json=payload
             )
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 202:
+                data = self.wait_for_job(response)
                 print(f"✅ Player collection successful")
                 print(f"   Players collected: {data['players_collected']}")
                 print(f"   Data source: {data['data_source']}")
@@ -117,8 +132,8 @@ class MLBDataServiceTester:
             # Trigger games collection
             response = self.session.post(f"{self.base_url}/api/v1/collect/games")
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 202:
+                data = self.wait_for_job(response)
                 print(f"✅ Games collection successful")
                 print(f"   Games collected: {data['games_collected']}")
                 print(f"   Data source: {data['data_source']}")
@@ -159,8 +174,8 @@ class MLBDataServiceTester:
                 json=payload
             )
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 202:
+                data = self.wait_for_job(response)
                 print(f"✅ Statcast collection successful")
                 print(f"   Records collected: {data['records_collected']}")
                 print(f"   Days back: {data['days_back']}")
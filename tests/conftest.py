@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Test Fixtures
+================================
+
+The service apps imported against stub connection pools, with the scheduler
+disabled and logs written under the test's temporary directory.
+"""
+
+import importlib
+import os
+
+import pytest
+
+from mlb_data_service import database, enhanced_database
+
+SERVICE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mlb_data_service')
+
+
+class StubPool:
+    """Connection pool whose connections are never needed by these tests"""
+
+    closed = False
+
+    def __init__(self, *args, **kwargs):
+        self._used = {}
+        self._pool = []
+
+    def getconn(self):
+        raise RuntimeError('database not available in tests')
+
+    def putconn(self, conn):
+        pass
+
+    def closeall(self):
+        pass
+
+
+@pytest.fixture(scope='session')
+def service(tmp_path_factory):
+    """mlb_data_service.app, the main service"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, 'ThreadedConnectionPool', StubPool)
+        mp.setattr(enhanced_database, 'ThreadedConnectionPool', StubPool)
+        mp.setenv('SCHEDULER_ENABLED', 'false')
+        mp.setenv('LOG_FILE', str(tmp_path_factory.mktemp('logs') / 'mlb_data_service.log'))
+        yield importlib.import_module('mlb_data_service.app')
+
+
+@pytest.fixture(scope='session')
+def enhanced_service():
+    """enhanced_app, imported with its flat module names as gunicorn --chdir does"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(SERVICE_DIR)
+        flat_database = importlib.import_module('enhanced_database')
+        mp.setattr(flat_database, 'ThreadedConnectionPool', StubPool)
+        yield importlib.import_module('enhanced_app')
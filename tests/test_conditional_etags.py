@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Conditional GET Tests
+========================================
+
+Repeat polls carrying a compressed ETag must be answered with 304 before the
+view loads or serializes anything, against a stub connection pool.
+"""
+
+
+def test_gzip_client_etag_skips_loader(service, monkeypatch):
+    calls = []
+
+    def get_players(limit=None):
+        calls.append(limit)
+        return [{'player_id': f'player_{i}', 'full_name': 'Test Player ' * 4} for i in range(50)]
+
+    monkeypatch.setattr(service.db_manager, 'get_players', get_players)
+    service.players_cache.clear()
+    client = service.app.test_client()
+
+    first = client.get('/api/v1/players', headers={'Accept-Encoding': 'gzip'})
+    assert first.status_code == 200
+    assert first.headers['Content-Encoding'] == 'gzip'
+    etag = first.headers['ETag']
+    assert etag.endswith(':gzip"')
+
+    # A cold cache would call the loader again if the ETag were not recognized
+    service.players_cache.clear()
+    second = client.get('/api/v1/players', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert second.status_code == 304
+    assert len(calls) == 1
+
+
+def test_plain_etag_still_matches(service):
+    with service.app.test_request_context(headers={'If-None-Match': '"abc"'}):
+        assert service.etag_requested('abc')
+        assert not service.etag_requested('abd')
+    with service.app.test_request_context(headers={'If-None-Match': '"abc:br"'}):
+        assert service.etag_requested('abc')
+
+
+def test_collection_in_another_worker_clears_read_caches(service, monkeypatch):
+    last_collections = {'players': '2026-04-01T10:00:00'}
+    monkeypatch.setattr(service.db_manager, 'get_last_collections', lambda: dict(last_collections))
+    service.last_collections_cache.clear()
+    service.sync_collection_caches()
+    service.players_cache.set('players:None', ['stale'])
+    service.games_cache.set('games', ['today'])
+
+    # Another worker logs a players completion; this worker sees it once
+    # the short last_collections window lapses
+    last_collections['players'] = '2026-04-01T11:00:00'
+    assert service.sync_collection_caches()['players'] == '2026-04-01T10:00:00'
+    service.last_collections_cache.clear()
+    assert service.sync_collection_caches()['players'] == '2026-04-01T11:00:00'
+
+    assert len(service.players_cache) == 0
+    assert len(service.games_cache) == 1
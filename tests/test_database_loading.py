@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Data Loading Tests
+=====================================
+
+Checks how DatabaseManager converts and writes collected rows, against
+recording cursors instead of a live database.
+"""
+
+from datetime import datetime
+
+import psycopg2
+import pytest
+
+from mlb_data_service import database
+
+
+@pytest.mark.parametrize('value', ['19:05', '07:05', '7:05', '19:5', '19:05:30', '25:00', '1905'])
+def test_game_time_parsing_matches_strptime(value):
+    try:
+        expected = datetime.strptime(value, '%H:%M').time()
+    except ValueError:
+        with pytest.raises(ValueError):
+            database._parse_hhmm_time(value)
+    else:
+        assert database._parse_hhmm_time(value) == expected
+
+
+class SavepointCursor:
+    """Cursor that records the SAVEPOINT statements around each load attempt"""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    """A DatabaseManager whose execute_values rejects any batch containing a 'bad' row"""
+    inserted = []
+
+    def execute_values(cursor, sql, rows, page_size=None):
+        if any(row[1] == 'bad' for row in rows):
+            raise psycopg2.DataError('invalid input syntax')
+        inserted.extend(rows)
+
+    monkeypatch.setattr(database, 'ThreadedConnectionPool', lambda *args, **kwargs: None)
+    monkeypatch.setattr(database, 'execute_values', execute_values)
+    db_manager = database.DatabaseManager('postgresql://test/test')
+    return db_manager, SavepointCursor(), inserted
+
+
+def failing_bulk_load():
+    raise psycopg2.DataError('COPY rejected the batch')
+
+
+def test_bulk_load_success_skips_fallback(loader):
+    db_manager, cursor, inserted = loader
+    rows = [(i, 'ok') for i in range(5)]
+
+    assert db_manager._load_with_fallback(cursor, 'players', lambda: None, 'INSERT', rows) == 5
+    assert inserted == []
+    assert cursor.executed == ['SAVEPOINT bulk_load', 'RELEASE SAVEPOINT bulk_load']
+
+
+def test_failed_bulk_load_bisects_down_to_bad_rows(loader):
+    db_manager, cursor, inserted = loader
+    rows = [(i, 'bad' if i in (2, 7) else 'ok') for i in range(10)]
+
+    stored = db_manager._load_with_fallback(cursor, 'players', failing_bulk_load, 'INSERT', rows,
+                                            page_size=4)
+
+    assert stored == 8
+    assert sorted(inserted) == [row for row in rows if row[1] == 'ok']
+    # Every savepoint is released, whether its batch went in or was rolled back
+    assert (cursor.executed.count('SAVEPOINT load_batch')
+            == cursor.executed.count('RELEASE SAVEPOINT load_batch'))
+    assert cursor.executed[:3] == ['SAVEPOINT bulk_load', 'ROLLBACK TO SAVEPOINT bulk_load',
+                                   'RELEASE SAVEPOINT bulk_load']
+
+
+def test_bad_row_only_fails_its_own_page(loader):
+    db_manager, cursor, inserted = loader
+    rows = [(i, 'bad' if i == 5 else 'ok') for i in range(8)]
+
+    assert db_manager._load_with_fallback(cursor, 'players', failing_bulk_load, 'INSERT', rows,
+                                          page_size=4) == 7
+    # The clean first page goes in as a single batch, without bisecting
+    assert inserted[:4] == rows[:4]
+    assert cursor.executed[3:5] == ['SAVEPOINT load_batch', 'RELEASE SAVEPOINT load_batch']
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Statcast Query Tests
+=======================================
+
+Checks the SQL, bound parameters and failure handling of DatabaseManager's
+Statcast reads, against a recording connection pool instead of a live database.
+"""
+
+import pytest
+
+from mlb_data_service import database
+
+
+class RecordingCursor:
+    """Cursor that records executed statements and returns a canned JSON row"""
+
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return ('{"statcast_data":[],"count":0,"source":"database"}',)
+
+    def __iter__(self):
+        yield {'batter': 545361, 'launch_speed': 101.2}
+        raise RuntimeError('server closed the connection unexpectedly')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class RecordingConnection:
+    def __init__(self, executed):
+        self.executed = executed
+
+    def cursor(self, name=None, cursor_factory=None):
+        return RecordingCursor(self.executed)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class RecordingPool:
+    def __init__(self, *args, **kwargs):
+        self.executed = []
+
+    def getconn(self):
+        return RecordingConnection(self.executed)
+
+    def putconn(self, conn):
+        pass
+
+
+@pytest.fixture
+def db_manager(monkeypatch):
+    monkeypatch.setattr(database, 'ThreadedConnectionPool', RecordingPool)
+    return database.DatabaseManager('postgresql://test/test')
+
+
+def test_filtered_statcast_json_binds_params_in_placeholder_order(db_manager):
+    assert db_manager.get_statcast_json(player_name='Mike Trout', limit=25) is not None
+
+    sql, params = db_manager.pool.executed[-1]
+    # 'player_filter' sits in the select list, ahead of the subquery's
+    # LOWER(%s) and LIMIT %s placeholders
+    assert sql.index("'player_filter', %s") < sql.index('LOWER(%s)') < sql.index('LIMIT %s')
+    assert params == ['Mike Trout', 'Mike Trout', 25]
+
+
+def test_unfiltered_statcast_json_binds_only_limit(db_manager):
+    db_manager.get_statcast_json(limit=25)
+
+    sql, params = db_manager.pool.executed[-1]
+    assert 'player_filter' not in sql
+    assert params == [25]
+
+
+def test_statcast_stream_failure_propagates(db_manager):
+    rows = db_manager.iter_statcast(limit=0)
+
+    assert next(rows) == {'batter': 545361, 'launch_speed': 101.2}
+    # A swallowed error would end the stream as if the rows ran out
+    with pytest.raises(RuntimeError):
+        next(rows)
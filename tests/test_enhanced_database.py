@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Enhanced Database Tests
+==========================================
+
+Checks EnhancedDatabaseManager's listing reads and loads against a recording
+connection pool instead of a live database.
+"""
+
+import pandas as pd
+import pytest
+
+from mlb_data_service import enhanced_database
+
+
+class InterruptedCursor:
+    """Server-side cursor that yields one row, then loses the connection"""
+
+    itersize = 0
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def __iter__(self):
+        yield from self.rows
+        raise RuntimeError('server closed the connection unexpectedly')
+
+    def close(self):
+        pass
+
+
+class LoadCursor:
+    """Cursor that records statements and the CSV rows COPYed through it"""
+
+    def __init__(self):
+        self.executed = []
+        self.copied = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def copy_expert(self, sql, buffer):
+        self.copied.extend(buffer.read().splitlines())
+
+    def close(self):
+        pass
+
+
+class RecordingConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self, name=None, cursor_factory=None):
+        return self._cursor
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class RecordingPool:
+    closed = False
+
+    def __init__(self, *args, **kwargs):
+        self.cursor = InterruptedCursor([])
+        self.returned = 0
+        self._used = {}
+        self._pool = []
+
+    def getconn(self):
+        return RecordingConnection(self.cursor)
+
+    def putconn(self, conn):
+        self.returned += 1
+
+    def closeall(self):
+        pass
+
+
+@pytest.fixture
+def db_manager(monkeypatch):
+    monkeypatch.setattr(enhanced_database, 'ThreadedConnectionPool', RecordingPool)
+    return enhanced_database.EnhancedDatabaseManager('postgresql://test/test')
+
+
+def test_batting_summary_stream_failure_propagates(db_manager):
+    db_manager.pool.cursor = InterruptedCursor([{'player_id': 1, 'wrc_plus': 150}])
+    rows = db_manager.iter_fangraphs_batting_summary(season=2026, limit=2000)
+
+    assert next(rows) == {'player_id': 1, 'wrc_plus': 150}
+    # A swallowed error would end the listing as if it were the last page
+    with pytest.raises(RuntimeError):
+        next(rows)
+    assert db_manager.pool.returned == 1
+
+
+def test_statcast_summary_stream_failure_propagates(db_manager):
+    rows = db_manager.iter_statcast_summary(limit=2000)
+
+    with pytest.raises(RuntimeError):
+        list(rows)
+    assert db_manager.pool.returned == 1
+
+
+def test_pitching_load_upserts_one_row_per_pitcher(db_manager, monkeypatch):
+    frame = pd.DataFrame({
+        'IDfg': [10, 11, 10],
+        'Name': ['Pitcher A', 'Pitcher B', 'Pitcher A'],
+        'ERA': [3.10, 4.20, 2.95],
+    })
+
+    class FakePybaseball:
+        @staticmethod
+        def pitching_stats(season, qual, ind):
+            return frame
+
+    monkeypatch.setattr(enhanced_database, '_pybaseball', lambda: FakePybaseball)
+    cursor = db_manager.pool.cursor = LoadCursor()
+
+    assert db_manager.collect_and_store_fangraphs_pitching(season=2026) == 2
+
+    statements = [sql for sql, _ in cursor.executed]
+    # Existing rows are updated in place, not deleted and re-inserted
+    assert not any('DELETE' in sql for sql in statements)
+    assert 'ON CONFLICT ("IDfg", "Season") DO UPDATE' in statements[-1]
+    # The repeated pitcher is staged once, with its last row
+    assert cursor.copied == ['11,Pitcher B,4.2,2026', '10,Pitcher A,2.95,2026']
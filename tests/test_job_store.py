@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Collection Job Store Tests
+=============================================
+
+Checks the statements CollectionJobStore sends for job submission, progress
+and lookup, against a recording connection instead of a live database.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from mlb_data_service.job_store import CollectionJobStore
+
+
+class ScriptedCursor:
+    """Cursor that records statements and answers fetches from a script"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append((' '.join(sql.split()), params))
+
+    def fetchone(self):
+        return self.connection.results.pop(0)
+
+    def fetchall(self):
+        return self.connection.results.pop(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class ScriptedConnection:
+    def __init__(self):
+        self.executed = []
+        self.results = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, cursor_factory=None):
+        return ScriptedCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def store():
+    connection = ScriptedConnection()
+    job_store = CollectionJobStore(lambda: connection, lambda conn: None, retention_seconds=3600)
+    return job_store, connection
+
+
+def statements(connection):
+    return [sql for sql, _ in connection.executed]
+
+
+def test_create_locks_prunes_and_inserts(store):
+    job_store, connection = store
+
+    job_id, created = job_store.create('players', {'limit': 25})
+
+    assert created
+    assert len(job_id) == 32
+    sql = statements(connection)
+    assert sql[0] == 'SELECT pg_advisory_xact_lock(hashtext(%s))'
+    assert connection.executed[0][1] == ('collection_jobs:players',)
+    assert sql[1].startswith('DELETE FROM collection_jobs WHERE submitted_at <')
+    assert sql[2].startswith('INSERT INTO collection_jobs')
+    assert connection.executed[2][1][0] == job_id
+    assert connection.commits == 1
+
+
+def test_create_joins_a_pending_job_within_the_dedupe_window(store):
+    job_store, connection = store
+    connection.results.append({'job_id': 'a' * 32})
+
+    job_id, created = job_store.create('statcast', {'days_back': 1}, dedupe_seconds=600)
+
+    assert (job_id, created) == ('a' * 32, False)
+    assert not any(sql.startswith('INSERT') for sql in statements(connection))
+    lookup_sql, lookup_params = connection.executed[2]
+    assert "status IN ('queued', 'running')" in lookup_sql
+    assert lookup_params[0] == 'statcast' and lookup_params[2] == 600
+
+
+def test_create_inserts_when_no_job_is_pending(store):
+    job_store, connection = store
+    connection.results.append(None)
+
+    _, created = job_store.create('statcast', {'days_back': 1}, dedupe_seconds=600)
+
+    assert created
+    assert statements(connection)[-1].startswith('INSERT INTO collection_jobs')
+
+
+def test_run_records_running_then_completed(store):
+    job_store, connection = store
+
+    assert job_store.run('job1', lambda limit: {'records': limit}, 5) == {'records': 5}
+
+    updates = [params for sql, params in connection.executed if sql.startswith('UPDATE')]
+    assert [params[0] for params in updates] == ['running', 'completed']
+    assert updates[1][1].adapted == {'records': 5}
+
+
+def test_run_records_failure_and_reraises(store):
+    job_store, connection = store
+
+    def collect():
+        raise RuntimeError('MLB API unavailable')
+
+    with pytest.raises(RuntimeError):
+        job_store.run('job1', collect)
+
+    updates = [params for sql, params in connection.executed if sql.startswith('UPDATE')]
+    assert [params[0] for params in updates] == ['running', 'failed']
+    assert updates[1][2] == 'MLB API unavailable'
+
+
+def test_get_returns_iso_timestamps_or_none(store):
+    job_store, connection = store
+    submitted = datetime(2026, 4, 1, 7, 0, 0)
+    connection.results.extend([
+        {'job_id': 'job1', 'collection_type': 'players', 'parameters': {}, 'status': 'running',
+         'submitted_at': submitted, 'finished_at': None, 'result': None, 'error_message': None},
+        None,
+    ])
+
+    job = job_store.get('job1')
+    assert job['submitted_at'] == '2026-04-01T07:00:00'
+    assert job['finished_at'] is None
+    assert job_store.get('missing') is None
+
+
+def test_last_completed_maps_types_to_finish_times(store):
+    job_store, connection = store
+    connection.results.append([
+        {'collection_type': 'statcast', 'finished_at': datetime(2026, 4, 1, 8, 30)},
+    ])
+
+    assert job_store.last_completed() == {'statcast': '2026-04-01T08:30:00'}
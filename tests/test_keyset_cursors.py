@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Keyset Cursor Tests
+======================================
+
+Listing cursors must round-trip the last row's sort key, reject tampered
+input, and seek past NULL wRC+ rows, against a stub connection pool.
+"""
+
+from datetime import date
+
+import pytest
+
+from mlb_data_service import enhanced_database
+
+BATTING_KEYS = ('wrc_plus', 'player_id')
+STATCAST_KEYS = ('game_date', 'launch_speed', 'game_pk', 'at_bat_number', 'pitch_number')
+
+
+def test_cursor_round_trips_sort_key(enhanced_service):
+    row = {'game_date': date(2026, 4, 1), 'launch_speed': 101.4, 'game_pk': 745001,
+           'at_bat_number': 12, 'pitch_number': 3, 'player_name': 'Not In Cursor'}
+
+    cursor = enhanced_service.encode_cursor(row, STATCAST_KEYS)
+
+    assert '=' not in cursor
+    assert enhanced_service.decode_cursor(cursor, STATCAST_KEYS) == {
+        'game_date': '2026-04-01', 'launch_speed': 101.4, 'game_pk': 745001,
+        'at_bat_number': 12, 'pitch_number': 3,
+    }
+
+
+def test_cursor_keeps_null_sort_values(enhanced_service):
+    cursor = enhanced_service.encode_cursor({'wrc_plus': None, 'player_id': 19755}, BATTING_KEYS)
+
+    assert enhanced_service.decode_cursor(cursor, BATTING_KEYS) == {'wrc_plus': None, 'player_id': 19755}
+
+
+@pytest.mark.parametrize('cursor', ['not base64!', 'e30', 'WzEsMl0', 'eyJ3cmNfcGx1cyI6MTUwfQ', ''])
+def test_malformed_cursor_is_rejected(enhanced_service, cursor):
+    # e30 is {}, WzEsMl0 is [1,2], and the last one is missing player_id
+    assert enhanced_service.decode_cursor(cursor, BATTING_KEYS) is None
+
+
+def test_next_page_cursor_only_on_full_pages(enhanced_service):
+    rows = [{'wrc_plus': 150 - i, 'player_id': i} for i in range(3)]
+
+    assert enhanced_service.next_page_cursor([], 3, BATTING_KEYS) is None
+    assert enhanced_service.next_page_cursor(rows[:2], 3, BATTING_KEYS) is None
+    cursor = enhanced_service.next_page_cursor(rows, 3, BATTING_KEYS)
+    assert enhanced_service.decode_cursor(cursor, BATTING_KEYS) == {'wrc_plus': 148, 'player_id': 2}
+
+
+def test_batting_listing_pages_with_returned_cursor(enhanced_service, monkeypatch):
+    calls = []
+
+    def get_fangraphs_batting_summary(season=None, limit=10, after=None):
+        calls.append(after)
+        return [{'player_id': 100 - i, 'wrc_plus': 140 - i} for i in range(limit)]
+
+    monkeypatch.setattr(enhanced_service.db_manager, 'get_fangraphs_batting_summary',
+                        get_fangraphs_batting_summary)
+    client = enhanced_service.app.test_client()
+
+    first = client.get('/api/v1/fangraphs/batting?season=2026&limit=2').get_json()
+    second = client.get(f"/api/v1/fangraphs/batting?season=2026&limit=2&after={first['next_cursor']}")
+
+    assert second.status_code == 200
+    assert calls == [None, {'wrc_plus': 139, 'player_id': 99}]
+    assert client.get('/api/v1/fangraphs/batting?after=e30').status_code == 400
+
+
+def test_batting_seek_after_ranked_row_continues_into_nulls():
+    db_manager = object.__new__(enhanced_database.EnhancedDatabaseManager)
+
+    sql, params = db_manager._batting_summary_query(2026, 20, {'wrc_plus': 95, 'player_id': 19755})
+
+    assert '(("wRC+", "IDfg") < (%(after_wrc_plus)s, %(after_id)s) OR "wRC+" IS NULL)' in sql
+    assert params == {'season': 2026, 'limit': 20, 'after_wrc_plus': 95, 'after_id': 19755}
+
+
+def test_batting_seek_after_null_row_stays_among_nulls():
+    db_manager = object.__new__(enhanced_database.EnhancedDatabaseManager)
+
+    sql, params = db_manager._batting_summary_query(2026, 20, {'wrc_plus': None, 'player_id': 19755})
+
+    # A row comparison against NULL matches nothing, so the last page of
+    # unranked players would never be reached
+    assert 'AND "wRC+" IS NULL AND "IDfg" < %(after_id)s' in sql
+    assert 'after_wrc_plus' not in params
+    assert params['after_id'] == 19755
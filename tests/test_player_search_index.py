@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Player Search Index Tests
+============================================
+
+Checks that name searches fall back to the database until the register is
+loaded, and that failed or empty reloads keep serving the previous copy.
+"""
+
+import pandas as pd
+
+from mlb_data_service.player_search_index import PlayerSearchIndex
+
+
+def register(*players):
+    return pd.DataFrame(
+        [{'player_id': player_id, 'full_name': full_name, 'name_last': name_last}
+         for player_id, full_name, name_last in players]
+    )
+
+
+def wait_for_refresh(index):
+    """Block until the background refresh thread releases its lock"""
+    assert index._refresh_lock.acquire(timeout=5)
+    index._refresh_lock.release()
+
+
+def test_search_falls_back_until_first_load():
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return register((1, 'José Ramírez', 'Ramírez'), (2, None, 'Ohtani'))
+
+    index = PlayerSearchIndex(loader)
+
+    assert index.search('jose') is None
+    wait_for_refresh(index)
+
+    assert index.search('jose') == [{'player_id': 1, 'full_name': 'José Ramírez'}]
+    # Missing full names are matched on the last name instead
+    assert index.search('ohtani') == [{'player_id': 2, 'full_name': None}]
+    assert len(loads) == 1
+
+
+def test_empty_reload_keeps_previous_copy():
+    frames = [register((1, 'Mookie Betts', 'Betts')), pd.DataFrame(), None]
+    index = PlayerSearchIndex(lambda: frames.pop(0))
+
+    assert index.refresh()
+    assert not index.refresh()
+    assert not index.refresh()
+    assert index.search('betts') == [{'player_id': 1, 'full_name': 'Mookie Betts'}]
+
+
+def test_failed_load_is_retried_after_retry_interval():
+    outcomes = [RuntimeError('connection refused'), register((1, 'Aaron Judge', 'Judge'))]
+
+    def loader():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    index = PlayerSearchIndex(loader, retry_seconds=0)
+
+    assert index.search('judge') is None
+    wait_for_refresh(index)
+    assert index.search('judge') is None
+    wait_for_refresh(index)
+
+    assert index.search('judge') == [{'player_id': 1, 'full_name': 'Aaron Judge'}]
+    assert outcomes == []
+
+
+def test_loaded_index_is_not_reloaded_before_refresh_interval():
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return register((1, 'Juan Soto', 'Soto'), (2, 'Juan Marichal', 'Marichal'))
+
+    index = PlayerSearchIndex(loader, refresh_seconds=3600)
+    index.refresh()
+
+    assert [row['player_id'] for row in index.search('juan', limit=1)] == [1]
+    assert index.search('juan', limit=0) == []
+    assert len(loads) == 1
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+MLB Data Service - Scheduler Lock Tests
+=======================================
+
+Only the worker holding the scheduler lock file runs the scheduler; the
+others report its pid and turn manual triggers away.
+"""
+
+import fcntl
+import os
+
+import pytest
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.stopped = False
+
+    def get_job_status(self):
+        return {'status': 'running', 'jobs': []}
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def scheduler_env(service, monkeypatch, tmp_path):
+    lock_path = tmp_path / 'mlb-scheduler.lock'
+    monkeypatch.setattr(service, 'SCHEDULER_ENABLED', True)
+    monkeypatch.setattr(service, 'SCHEDULER_LOCK_PATH', str(lock_path))
+    monkeypatch.setattr(service, 'start_scheduler', lambda url: FakeScheduler())
+    yield service, lock_path
+    service.shutdown_scheduler()
+
+
+def test_first_worker_takes_lock_and_records_pid(scheduler_env):
+    service, lock_path = scheduler_env
+
+    scheduler = service.start_scheduler_once()
+
+    assert isinstance(scheduler, FakeScheduler)
+    assert lock_path.read_text() == str(os.getpid())
+    assert service.scheduler_job_status()['status'] == 'running'
+
+    service.shutdown_scheduler()
+    assert scheduler.stopped
+    assert service.scheduler_lock_fd is None
+
+
+def test_other_workers_report_owner(scheduler_env):
+    service, lock_path = scheduler_env
+    owner_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+    try:
+        fcntl.flock(owner_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.write(owner_fd, b'4242')
+
+        assert service.start_scheduler_once() is None
+        assert service.scheduler_job_status() == {
+            'status': 'owned_by_other_worker', 'owner_pid': 4242, 'jobs': []
+        }
+        response = service.app.test_client().post('/api/v1/scheduler/trigger')
+        assert response.status_code == 409
+    finally:
+        os.close(owner_fd)
+
+
+def test_trigger_unavailable_when_disabled(service, monkeypatch):
+    monkeypatch.setattr(service, 'SCHEDULER_ENABLED', False)
+
+    assert service.scheduler_job_status() == {'status': 'disabled', 'jobs': []}
+    assert service.app.test_client().post('/api/v1/scheduler/trigger').status_code == 503